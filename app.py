@@ -4,9 +4,19 @@ Licensed under the GNU General Public License v3.0 - see LICENSE file for detail
 """
 
 import sys
-import os
 from PyQt6.QtWidgets import QApplication
-from main_window import MainWindow
+
+
+_APP_USER_MODEL_ID = 'opensource.locationvisualizer.1.0'
+
+
+def _set_app_user_model_id():
+    """Set the Windows taskbar identity (must happen before any window is shown)"""
+    try:
+        import ctypes
+        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(_APP_USER_MODEL_ID)
+    except:
+        pass
 
 
 def main():
@@ -17,22 +27,20 @@ def main():
     app.setApplicationVersion("1.0")
     app.setOrganizationName("OpenSource")
     
-    # Create and show main window
-    window = MainWindow()
+    # For Windows taskbar grouping (helps with custom icon display); must run
+    # before the first window (the startup disclaimer) gets a taskbar button
+    if sys.platform == 'win32':  # Windows
+        _set_app_user_model_id()
     
-    # Set the application icon for taskbar
-    icon = window.create_pushpin_icon()
-    app.setWindowIcon(icon)
+    # Import the widget stack only once the QApplication exists
+    from main_window import MainWindow
     
-    # For Windows taskbar grouping (helps with custom icon display)
-    if os.name == 'nt':  # Windows
-        try:
-            import ctypes
-            myappid = 'opensource.locationvisualizer.1.0'
-            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
-        except:
-            pass
+    # Set the application icon for taskbar before any window exists (the startup
+    # disclaimer runs inside MainWindow's constructor); painted once and cached
+    app.setWindowIcon(MainWindow.pushpin_icon())
     
+    # Create and show main window
+    window = MainWindow()
     window.show()
     
     sys.exit(app.exec())
@@ -0,0 +1,15 @@
+"""
+Open Source Location Data Visualizer - github.com/btc-git/OS-LOC-DAT-VIZ
+Licensed under the GNU General Public License v3.0 - see LICENSE file for details
+"""
+
+# Accepted column headers for each field, matched case-insensitively (kept free of pandas so the
+# GUI can detect a file's type from the same table the generator resolves columns with)
+COLUMN_ALIASES = {
+    'lat': ['latitude', 'lat'],
+    'lon': ['longitude', 'lon', 'long'],
+    'timestamp': ['timestamp', 'date & time', 'datetime', 'time'],
+    'azimuth': ['azimuth', 'bearing', 'direction'],
+    'distance': ['distance', 'range', 'distance (m)', 'distance (meters)'],
+    'accuracy': ['gps accuracy', 'accuracy', 'gps_accuracy'],
+}
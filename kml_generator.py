@@ -4,18 +4,445 @@ Licensed under the GNU General Public License v3.0 - see LICENSE file for detail
 """
 
 import pandas as pd
+import numpy as np
+import io
 import math
+import tempfile
 import textwrap
 import re
+import shutil
+import zipfile
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import compress
 from pathlib import Path
 from PyQt6.QtCore import QThread, pyqtSignal
+from columns import COLUMN_ALIASES
+
+# Bearings of a closed circle outline, every 10 degrees (36 points + closing point)
+CIRCLE_BEARINGS = np.arange(0, 370, 10, dtype=np.float64)
+CIRCLE_SIN_B = np.sin(np.radians(CIRCLE_BEARINGS))
+CIRCLE_COS_B = np.cos(np.radians(CIRCLE_BEARINGS))
+
+# Unit scales, resolved once per run from the units settings (unknown units fall back to meters)
+GPS_MILES_PER_UNIT = {
+    'Meters': 0.000621371,
+    'Feet': 0.000189394,
+    'Miles': 1.0,
+    'Kilometers': 0.621371,
+}
+TA_UNITS_PER_MILE = {
+    'Meters': 1609.34,
+    'Feet': 5280,
+    'Miles': 1,
+    'Kilometers': 1.60934,
+}
+
+# Accuracy used when a value is present but not a number (10 meters)
+FALLBACK_ACCURACY_MILES = 10 * 0.000621371
+
+# Day zero of Excel serial dates
+EXCEL_EPOCH = datetime(1899, 12, 30)
+
+# Plain decimal numbers (candidate Excel serials), checked before calling float()
+_LOOKS_NUMERIC_RE = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?$')
+
+# Timezone and sub-second noise stripped before pattern matching
+_TS_CLEAN_GMT = re.compile(r'\s*\([^)]*GMT[^)]*\)')  # (GMT -4) style
+_TS_CLEAN_UTC = re.compile(r'\s*\([^)]*UTC[^)]*\)')  # (UTC±X) style
+_TS_CLEAN_TZ = re.compile(r'\s+[A-Z]{3,4}(?:\s|$)')  # EST, UTC, GMT suffix
+_TS_CLEAN_MS = re.compile(r'(\d{2}):(\d{2}):(\d{2})\.\d+')
+
+# Common timestamp patterns, tagged with the field order of the date part
+_TS_PATTERNS = tuple((re.compile(pattern), kind) for pattern, kind in [
+    # ISO format variations
+    (r'(\d{4})-(\d{1,2})-(\d{1,2})[T\s](\d{1,2}):(\d{1,2}):(\d{1,2})', 'ymd'),
+    (r'(\d{4})-(\d{1,2})-(\d{1,2})[T\s](\d{1,2}):(\d{1,2})', 'ymd'),
+    (r'(\d{4})-(\d{1,2})-(\d{1,2})', 'ymd'),
+    # ISO forward-slash format (2025/02/03 18:36:04)
+    (r'(\d{4})/(\d{1,2})/(\d{1,2})[T\s](\d{1,2}):(\d{1,2}):(\d{1,2})', 'ymd'),
+    (r'(\d{4})/(\d{1,2})/(\d{1,2})[T\s](\d{1,2}):(\d{1,2})', 'ymd'),
+    (r'(\d{4})/(\d{1,2})/(\d{1,2})', 'ymd'),
+    # US format variations (with 4-digit years)
+    (r'(\d{1,2})/(\d{1,2})/(\d{4})[T\s](\d{1,2}):(\d{1,2}):(\d{1,2})', 'mdy'),
+    (r'(\d{1,2})/(\d{1,2})/(\d{4})[T\s](\d{1,2}):(\d{1,2})', 'mdy'),
+    (r'(\d{1,2})/(\d{1,2})/(\d{4})', 'mdy'),
+    # US format with 2-digit years (07/30/24 13:00:20)
+    (r'(\d{1,2})/(\d{1,2})/(\d{2})[T\s](\d{1,2}):(\d{1,2}):(\d{1,2})', 'mdy'),
+    (r'(\d{1,2})/(\d{1,2})/(\d{2})[T\s](\d{1,2}):(\d{1,2})', 'mdy'),
+    (r'(\d{1,2})/(\d{1,2})/(\d{2})', 'mdy'),
+    # European format variations (DD.MM.YYYY)
+    (r'(\d{1,2})\.(\d{1,2})\.(\d{4})[T\s](\d{1,2}):(\d{1,2}):(\d{1,2})', 'dmy'),
+    (r'(\d{1,2})\.(\d{1,2})\.(\d{4})[T\s](\d{1,2}):(\d{1,2})', 'dmy'),
+    (r'(\d{1,2})\.(\d{1,2})\.(\d{4})', 'dmy'),
+    # Time-only (use today's date), optional seconds and AM/PM
+    (r'(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?\s*([APap][Mm])?', 'time'),
+])
+
+
+def _read_csv(path):
+    """Read a CSV file with pandas' C parser (short rows padded, duplicate headers renamed)"""
+    return pd.read_csv(path)
+
+
+def _read_xlsx(path):
+    """Read the first worksheet through openpyxl's streaming read-only mode (cell values only)"""
+    import openpyxl
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].values
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        # Without a <dimension> record read-only rows end at their last cell, so pad every
+        # row (and the header, with 'Unnamed: N' names) to the widest one as read_excel did
+        rows = list(rows)
+        width = max([len(header), *map(len, rows)])
+        header = header + (None,) * (width - len(header))
+        rows = [row + (None,) * (width - len(row)) for row in rows]
+        return pd.DataFrame(rows, columns=_unique_headers(header))
+    finally:
+        workbook.close()
+
+
+def _unique_headers(header):
+    """String column names with blanks and duplicates renamed the way read_csv does ('Unnamed: 4', 'Latitude.1')"""
+    names = []
+    counts = {}
+    for i, cell in enumerate(header):
+        name = f'Unnamed: {i}' if cell is None or str(cell).strip() == '' else str(cell)
+        count = counts.get(name, 0)
+        counts[name] = count + 1
+        while count:
+            candidate = f'{name}.{count}'
+            if candidate not in counts:
+                counts[candidate] = 1
+                name = candidate
+                break
+            count += 1
+        names.append(name)
+    return names
+
+
+def _resolve_columns(df, aliases_map):
+    """Map each field to the first matching column in df (or None), scanning the headers once"""
+    headers = {}
+    for col in df.columns:
+        headers.setdefault(str(col).strip().lower(), col)
+    return {field: next((headers[a] for a in aliases if a in headers), None)
+            for field, aliases in aliases_map.items()}
+
+
+def _numeric_column(df, col):
+    """Column as a numeric ndarray (NaN for malformed values, all NaN when the column is absent)"""
+    if col is None:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+
+
+def _display_number(value):
+    """Number as shown in descriptions: whole values without a trailing '.0' (as the input cell showed them)"""
+    return str(int(value)) if value.is_integer() else str(value)
+
+
+def _object_column(df, col):
+    """Column as an object ndarray (all None when the column is absent)"""
+    if col is None:
+        return np.full(len(df), None, dtype=object)
+    return df[col].to_numpy(dtype=object)
+
+
+def _rows_with_coordinates(df, lat_arr, lon_arr):
+    """Drop rows missing either coordinate; returns (df, lat_arr, lon_arr, 1-based source row numbers)"""
+    keep = np.flatnonzero(~np.isnan(lat_arr) & ~np.isnan(lon_arr))
+    return df.iloc[keep], lat_arr[keep], lon_arr[keep], (keep + 1).tolist()
+
+
+def destination_point(lat, lon, azimuth_deg, distance_miles):
+    """Calculate destination point given starting point, bearing and distance"""
+    R = 3960.0  # Earth radius in miles
+    azimuth = math.radians(azimuth_deg)
+    lat1 = math.radians(lat)
+    lon1 = math.radians(lon)
+    d_div_r = distance_miles / R
+
+    if d_div_r < 1e-9:
+        return lat, lon
+
+    # Each trig term is evaluated once
+    sin_lat1, cos_lat1 = math.sin(lat1), math.cos(lat1)
+    sin_d, cos_d = math.sin(d_div_r), math.cos(d_div_r)
+
+    lat2 = math.asin(sin_lat1 * cos_d + cos_lat1 * sin_d * math.cos(azimuth))
+    lon2 = lon1 + math.atan2(math.sin(azimuth) * sin_d * cos_lat1,
+                             cos_d - sin_lat1 * math.sin(lat2))
+    return math.degrees(lat2), math.degrees(lon2)
+
+
+def destination_points(lat, lon, angles_deg, distance_miles):
+    """Vectorized destination_point: one (lats, lons) pair of arrays for all bearings"""
+    azimuth = np.radians(np.asarray(angles_deg, dtype=np.float64))
+    return _destination_points_sc(lat, lon, np.sin(azimuth), np.cos(azimuth), distance_miles)
+
+
+def _destination_points_sc(lat, lon, sin_bearings, cos_bearings, distance_miles):
+    """destination_points for bearings given as precomputed sin/cos arrays (fixed grids skip the trig)"""
+    R = 3960.0  # Earth radius in miles
+    d_div_r = distance_miles / R
+
+    if d_div_r < 1e-9:
+        return np.full(sin_bearings.shape, lat), np.full(sin_bearings.shape, lon)
+
+    lat1 = math.radians(lat)
+    lon1 = math.radians(lon)
+    sin_lat1, cos_lat1 = math.sin(lat1), math.cos(lat1)
+    sin_d, cos_d = math.sin(d_div_r), math.cos(d_div_r)
+
+    lat2 = np.arcsin(sin_lat1 * cos_d + cos_lat1 * sin_d * cos_bearings)
+    lon2 = lon1 + np.arctan2(sin_bearings * sin_d * cos_lat1,
+                             cos_d - sin_lat1 * np.sin(lat2))
+    return np.degrees(lat2), np.degrees(lon2)
+
+
+@lru_cache(maxsize=None)
+def _coordinate_block_tpl(indent, count):
+    """Format string for `count` coordinate lines at the given indent"""
+    return (indent + "{:.6f},{:.6f},0\n") * count
+
+
+def _coordinate_block(lats, lons, indent):
+    """Vertex arrays as one coordinates text block ('lon,lat,0' per line, 6 decimals ~10 cm), in a single format call"""
+    values = np.empty(2 * len(lats))
+    values[0::2] = lons
+    values[1::2] = lats
+    return _coordinate_block_tpl(indent, len(lats)).format(*values.tolist())
+
+
+def write_kml(kmz_path, dst):
+    """Stream the doc.kml of a KMZ into the writable binary file dst; the entry is not loaded whole"""
+    with zipfile.ZipFile(kmz_path) as kmz, kmz.open('doc.kml') as src:
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+# KML fragments, dedented once at import; *_TPL strings are filled in with str.format()
+KML_HEADER_TPL = textwrap.dedent('''\
+    <?xml version="1.0" encoding="UTF-8"?>
+    <kml xmlns="http://www.opengis.net/kml/2.2" xmlns:gx="http://www.google.com/kml/ext/2.2">
+    <Document>
+        <name>{doc_name}</name>
+        <gx:AnimatedUpdate>
+            <gx:duration>0.0</gx:duration>
+        </gx:AnimatedUpdate>
+''')
+
+# Styles shared by every placemark through <styleUrl>, written once in the Document header
+SHARED_STYLES_TPL = textwrap.indent(textwrap.dedent('''\
+    <Style id="label">
+        <IconStyle>
+            <scale>0</scale>
+        </IconStyle>
+        <LabelStyle>
+            <color>ffffffff</color>
+            <scale>0.8</scale>
+        </LabelStyle>
+    </Style>
+    <Style id="sector">
+        <LineStyle><color>{leg_color}</color><width>1</width></LineStyle>
+        <PolyStyle><color>{shaded_fill}</color></PolyStyle>
+    </Style>
+    <Style id="leg">
+        <LineStyle><color>{leg_color}</color><width>2</width></LineStyle>
+    </Style>
+    <Style id="gps">
+        <LineStyle>
+            <color>{gps_color}</color>
+            <width>2</width>
+        </LineStyle>
+        <PolyStyle>
+            <color>{gps_fill}</color>
+        </PolyStyle>
+    </Style>
+    <Style id="distance">
+        <LineStyle><color>{ta_color}</color><width>3</width></LineStyle>
+    </Style>
+'''), '    ')
+KML_FOOTER = textwrap.dedent('''\
+    </Document>
+    </kml>
+''')
+
+# Folder / Placemark openers
+FOLDER_OPEN_TPL = textwrap.dedent('''\
+    <Folder>
+        <name>{name}</name>
+''')
+PLACEMARK_OPEN_TPL = textwrap.dedent('''\
+    <Placemark>
+        <name>{name}</name>
+''')
+SPACED_PLACEMARK_OPEN_TPL = "\n" + PLACEMARK_OPEN_TPL  # after a blank line
+
+# Invisible center point that carries the timestamp label
+LABEL_POINT_TPL = textwrap.dedent('''\
+        <styleUrl>#label</styleUrl>
+        <Point>
+            <coordinates>{lon:.6f},{lat:.6f},0</coordinates>
+        </Point>
+    </Placemark>
+''')
+LABEL_POINT_FOLDER_END_TPL = textwrap.dedent('''\
+            <styleUrl>#label</styleUrl>
+            <Point>
+                <coordinates>{lon:.6f},{lat:.6f},0</coordinates>
+            </Point>
+        </Placemark>
+    </Folder>
+''')
+
+# Shaded sector wedge and 360° circle
+SECTOR_STYLE_TPL = textwrap.dedent('''\
+    <styleUrl>#sector</styleUrl>
+    <Polygon>
+        <outerBoundaryIs><LinearRing><coordinates>
+            {lon:.6f},{lat:.6f},0
+''')
+CIRCLE_STYLE = textwrap.dedent('''\
+    <styleUrl>#sector</styleUrl>
+    <Polygon>
+        <outerBoundaryIs><LinearRing><coordinates>
+''')
+POLYGON_END = textwrap.dedent('''\
+            </coordinates></LinearRing></outerBoundaryIs>
+        </Polygon>
+    </Placemark>
+''')
+
+# Directional legs
+LEG_TPL = textwrap.dedent('''\
+        <styleUrl>#leg</styleUrl>
+        <LineString>
+            <coordinates>
+                {lon:.6f},{lat:.6f},0
+                {end_lon:.6f},{end_lat:.6f},0
+            </coordinates>
+        </LineString>
+    </Placemark>
+''')
+LEG_FOLDER_END_TPL = textwrap.dedent('''\
+            <styleUrl>#leg</styleUrl>
+            <LineString>
+                <coordinates>
+                    {lon:.6f},{lat:.6f},0
+                    {end_lon:.6f},{end_lat:.6f},0
+                </coordinates>
+            </LineString>
+        </Placemark>
+    </Folder>
+''')
+
+# Location point accuracy circle
+GPS_CIRCLE_STYLE = textwrap.dedent('''\
+    <styleUrl>#gps</styleUrl>
+    <Polygon>
+        <outerBoundaryIs>
+            <LinearRing>
+                <coordinates>
+''')
+GPS_CIRCLE_END = textwrap.dedent('''\
+                    </coordinates>
+                </LinearRing>
+            </outerBoundaryIs>
+        </Polygon>
+    </Placemark>
+''')
+
+# Combined sector + distance arc
+TOWER_SECTOR_OPEN_TPL = textwrap.dedent('''\
+    <Placemark>
+        <name>{display_label} Tower Sector</name>
+        <description>
+            Tower: {lat:.6f}, {lon:.6f}
+            Azimuth: {azimuth}°
+            Sector Width: {azimuth_spread}°
+            Distance: {distance_miles:.2f} miles
+        </description>
+''')
+COMBINED_SECTOR_STYLE_TPL = textwrap.dedent('''\
+    <styleUrl>#sector</styleUrl>
+    <Polygon>
+        <outerBoundaryIs>
+            <LinearRing>
+                <coordinates>
+                    {lon:.6f},{lat:.6f},0
+''')
+COMBINED_SECTOR_END_TPL = textwrap.dedent('''\
+                        {lon:.6f},{lat:.6f},0
+                    </coordinates>
+                </LinearRing>
+            </outerBoundaryIs>
+        </Polygon>
+    </Placemark>
+''')
+
+# Distance arc / circle line
+DISTANCE_LINE_STYLE = textwrap.dedent('''\
+    <styleUrl>#distance</styleUrl>
+    <LineString>
+        <coordinates>
+''')
+LINE_END = textwrap.dedent('''\
+            </coordinates>
+        </LineString>
+    </Placemark>
+''')
+
+# Whole combined sector + distance arc folder as one template, rendered with a single format() call
+COMBINED_SECTOR_AND_ARC_TPL = "".join([
+    FOLDER_OPEN_TPL.replace('{name}', '{display_label}'),
+    '{time}',
+    TOWER_SECTOR_OPEN_TPL,
+    '{child_time}',
+    COMBINED_SECTOR_STYLE_TPL,
+    '{sector_block}',
+    COMBINED_SECTOR_END_TPL,
+    PLACEMARK_OPEN_TPL.replace('{name}', '{display_label} Left Leg'),
+    '{child_time}',
+    LEG_TPL.replace('{end_lon', '{left_lon').replace('{end_lat', '{left_lat'),
+    PLACEMARK_OPEN_TPL.replace('{name}', '{display_label} Right Leg'),
+    '{child_time}',
+    LEG_TPL.replace('{end_lon', '{right_lon').replace('{end_lat', '{right_lat'),
+    PLACEMARK_OPEN_TPL.replace('{name}', '{display_label} Distance Arc ({distance_miles:.2f} mi)'),
+    '{child_time}',
+    DISTANCE_LINE_STYLE,
+    '{arc_block}',
+    LINE_END,
+    PLACEMARK_OPEN_TPL.replace('{name}', '{display_label}'),
+    '{child_time}',
+    LABEL_POINT_FOLDER_END_TPL,
+])
+
+# Uncertainty circle and pin
+UNCERTAINTY_STYLE_TPL = textwrap.dedent('''\
+    <Style>
+        <LineStyle><color>{ta_color}</color><width>1</width></LineStyle>
+        <PolyStyle><color>{ta_fill}</color></PolyStyle>
+    </Style>
+    <Polygon>
+        <outerBoundaryIs><LinearRing><coordinates>
+''')
+PIN_TPL = textwrap.dedent('''\
+        <Style><IconStyle><color>{color}</color></IconStyle></Style>
+        <Point>
+            <coordinates>{lon:.6f},{lat:.6f},0</coordinates>
+        </Point>
+    </Placemark>
+''')
 
 
 class KMLGenerator(QThread):
     """Background thread for KML generation"""
     progress = pyqtSignal(int)
-    finished = pyqtSignal(str)  # KML content
+    finished = pyqtSignal(str)  # path of the generated KMZ (temporary file, caller moves or deletes it)
     error = pyqtSignal(str)     # error message
     status_message = pyqtSignal(str)  # status messages for console
     
@@ -24,180 +451,197 @@ class KMLGenerator(QThread):
         self.data_file = data_file
         self.data_type = data_type
         self.settings = settings
+        self._time_elem_cache = {}  # (kml_timestamp, indent) -> TimeSpan element
+        self._sector_cache = {}  # (lat, lon, azimuth) -> sector arc block and leg end points
+        self._circle_cache = {}  # (lat, lon, radius_miles, indent) -> circle coordinates block
     
     def run(self):
+        kmz_path = None
         try:
+            self.load_settings()
+            
             # Load data
             self.progress.emit(10)
             
-            # Read file based on extension (with Excel date handling)
+            # Read file based on extension (Excel date cells arrive as datetimes)
             file_extension = Path(self.data_file).suffix.lower()
             if file_extension == '.xlsx':
-                # Read Excel with proper date parsing
-                df = pd.read_excel(self.data_file, engine='openpyxl')
+                df = _read_xlsx(self.data_file)
             elif file_extension == '.csv':
-                df = pd.read_csv(self.data_file)
+                df = _read_csv(self.data_file)
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}")
             
-            # Generate KML based on data type
+            # Generate KML based on data type, streamed through deflate into the doc.kml of a temporary KMZ
+            # (a 1 MB byte buffer hands zlib large blocks instead of the text layer's 8 KB chunks)
             self.progress.emit(30)
-            if self.data_type == "Tower/Sector":
-                kml_content = self.generate_cell_tower_kml(df)
-            elif self.data_type == "Distance from Tower":
-                kml_content = self.generate_timing_advance_kml(df)
-            elif self.data_type == "Location Point":
-                kml_content = self.generate_gps_kml(df)
-            else:
-                raise ValueError(f"Unknown data type: {self.data_type}")
+            with tempfile.NamedTemporaryFile('wb', suffix='.kmz', delete=False) as kmz_file:
+                kmz_path = kmz_file.name
+                with zipfile.ZipFile(kmz_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as kmz, \
+                        kmz.open('doc.kml', 'w') as entry, \
+                        io.TextIOWrapper(io.BufferedWriter(entry, 1 << 20), encoding='utf-8') as out:
+                    if self.data_type == "Tower/Sector":
+                        self.generate_cell_tower_kml(df, out)
+                    elif self.data_type == "Distance from Tower":
+                        self.generate_timing_advance_kml(df, out)
+                    elif self.data_type == "Location Point":
+                        self.generate_gps_kml(df, out)
+                    else:
+                        raise ValueError(f"Unknown data type: {self.data_type}")
             
             self.progress.emit(100)
-            self.finished.emit(kml_content)
+            self.finished.emit(kmz_path)
             
         except Exception as e:
+            if kmz_path:
+                Path(kmz_path).unlink(missing_ok=True)
             self.error.emit(str(e))
     
-    def destination_point(self, lat, lon, azimuth_deg, distance_miles):
-        """Calculate destination point given starting point, bearing and distance"""
-        R = 3960.0  # Earth radius in miles
-        azimuth = math.radians(azimuth_deg)
-        lat1 = math.radians(lat)
-        lon1 = math.radians(lon)
-        d_div_r = distance_miles / R
-
-        if d_div_r < 1e-9:
-            return lat, lon
-
-        lat2 = math.asin(math.sin(lat1) * math.cos(d_div_r) +
-                         math.cos(lat1) * math.sin(d_div_r) * math.cos(azimuth))
-        lon2 = lon1 + math.atan2(math.sin(azimuth) * math.sin(d_div_r) * math.cos(lat1),
-                                 math.cos(d_div_r) - math.sin(lat1) * math.sin(lat2))
-        return math.degrees(lat2), math.degrees(lon2)
+    def load_settings(self):
+        """Resolve the settings the placemark builders use into attributes, once per run"""
+        settings = self.settings
+        self._animate = settings.get('enable_time_animation', True)
+        self._duration_minutes = settings.get('duration_minutes', 30)
+        self._azimuth_spread = settings.get('azimuth_spread', 120)
+        self._half_spread = self._azimuth_spread / 2
+        self._num_points = settings.get('num_points', 20)
+        self._shaded_len = settings.get('shaded_area_length', 1.0)
+        self._leg_len = settings.get('leg_length', 3.0)
+        
+        # Sector arc bearings relative to the azimuth, shared by every sector
+        self._sector_offsets = np.linspace(-self._half_spread, self._half_spread, self._num_points + 1)
+        
+        # Line colors as given, fills with the alpha baked in
+        self._leg_color = settings['leg_color']
+        self._shaded_fill = '7d' + settings['shaded_color'][2:]
+        self._gps_color = settings['gps_color']
+        self._gps_fill = '4d' + settings['gps_color'][2:]
+        self._ta_color = settings['ta_color']
+        self._ta_fill = '7d' + settings['ta_color'][2:]
+        
+        # Fragments that only depend on settings, filled in once per run
+        self._uncertainty_style = UNCERTAINTY_STYLE_TPL.format(ta_color=self._ta_color, ta_fill=self._ta_fill)
+        self._shared_styles = SHARED_STYLES_TPL.format(
+            leg_color=self._leg_color, shaded_fill=self._shaded_fill,
+            gps_color=self._gps_color, gps_fill=self._gps_fill, ta_color=self._ta_color)
     
-    def generate_cell_tower_kml(self, df):
-        """Generate KML for tower/sector data"""
+    def sector_points(self, lat, lon, azimuth, distance_miles):
+        """Arc vertices (lats, lons) across the sector spread centred on azimuth"""
+        return destination_points(lat, lon, azimuth + self._sector_offsets, distance_miles)
+    
+    def circle_points(self, lat, lon, radius_miles):
+        """Closed circle vertices (lats, lons), every 10 degrees"""
+        return _destination_points_sc(lat, lon, CIRCLE_SIN_B, CIRCLE_COS_B, radius_miles)
+    
+    def generate_cell_tower_kml(self, df, out):
+        """Generate KML for tower/sector data, writing it to out"""
         # Use custom label if provided, otherwise default
         doc_name = self.settings.get('custom_label') or "Tower/Sector Data"
         
-        kml_header = textwrap.dedent(f'''\
-            <?xml version="1.0" encoding="UTF-8"?>
-            <kml xmlns="http://www.opengis.net/kml/2.2" xmlns:gx="http://www.google.com/kml/ext/2.2">
-            <Document>
-                <name>{doc_name}</name>
-                <gx:AnimatedUpdate>
-                    <gx:duration>0.0</gx:duration>
-                </gx:AnimatedUpdate>
-        ''')
-        
-        kml_footer = textwrap.dedent('''\
-            </Document>
-            </kml>
-        ''')
-        
-        placemarks = ""
-        total_rows = len(df)
-        missing_azimuth_count = 0
-        
-        for idx, (_, row) in enumerate(df.iterrows()):
-            if idx % 10 == 0:  # Update progress every 10 rows
-                progress = 30 + int((idx / total_rows) * 50)
+        out.write(KML_HEADER_TPL.format(doc_name=doc_name))
+        out.write(self._shared_styles)
+        
+        # Resolve columns once and work on plain arrays, keeping only rows with coordinates
+        columns = _resolve_columns(df, COLUMN_ALIASES)
+        df, lat_arr, lon_arr, row_numbers = _rows_with_coordinates(
+            df, _numeric_column(df, columns['lat']), _numeric_column(df, columns['lon']))
+        total_rows = len(row_numbers)
+        kml_timestamps, display_labels = self.parse_timestamp_column(df, columns['timestamp'])
+        azimuth_arr = _numeric_column(df, columns['azimuth'])
+        
+        # Missing-value masks, computed once per column
+        has_azimuth_mask = ~np.isnan(azimuth_arr)
+        missing_azimuth_count = int(np.count_nonzero(~has_azimuth_mask))
+        
+        # Walk the columns in lockstep as plain Python lists (no per-row array indexing)
+        rows = zip(row_numbers, lat_arr.tolist(), lon_arr.tolist(), kml_timestamps, display_labels,
+                   has_azimuth_mask.tolist(), azimuth_arr.tolist())
+        
+        last_progress = -1
+        for idx, (row_number, lat, lon, kml_timestamp, display_label, has_azimuth, azimuth) in enumerate(rows):
+            # Signal only when the percentage changes (at most ~50 cross-thread emits)
+            progress = 30 + (idx * 50) // total_rows
+            if progress != last_progress:
+                last_progress = progress
                 self.progress.emit(progress)
             
-            # Get required columns
-            lat = self.get_column_value(row, ['Latitude', 'lat', 'Lat'])
-            lon = self.get_column_value(row, ['Longitude', 'lon', 'Lon', 'Long'])
-            timestamp = self.get_column_value(row, ['Timestamp', 'Date & Time', 'DateTime', 'Time'])
-            azimuth = self.get_column_value(row, ['Azimuth', 'azimuth', 'bearing', 'direction'])
-            
-            if pd.isna(lat) or pd.isna(lon):
-                continue
-            
             # Use timestamp if available, otherwise use a generic label
-            if pd.isna(timestamp):
-                timestamp = f"Entry {idx + 1}"
+            if display_label is None:
+                display_label = f"Entry {row_number}"
             
             # Generate sector or circle based on azimuth availability
-            if not pd.isna(azimuth):
-                placemarks += self.create_sector_placemark(lat, lon, azimuth, timestamp)
+            if has_azimuth:
+                self.create_sector_placemark(out, lat, lon, azimuth, kml_timestamp, display_label)
             else:
-                missing_azimuth_count += 1
                 # Create 360-degree circle instead of directional wedge
-                placemarks += self.create_circle_placemark(lat, lon, timestamp)
+                self.create_circle_placemark(out, lat, lon, kml_timestamp, display_label)
         
         # Report missing azimuth data
         if missing_azimuth_count > 0:
             self.status_message.emit(f"⚠️ Tower/Sector Data: {missing_azimuth_count} points had no azimuth data - used 360° coverage circles")
         
-        return kml_header + placemarks + kml_footer
+        out.write(KML_FOOTER)
     
-    def generate_timing_advance_kml(self, df):
-        """Generate KML for distance from tower data with arc visualization"""
+    def generate_timing_advance_kml(self, df, out):
+        """Generate KML for distance from tower data with arc visualization, writing it to out"""
         # Use custom label if provided, otherwise default
         doc_name = self.settings.get('custom_label') or "Distance from Tower Analysis"
         
-        kml_header = textwrap.dedent(f'''\
-            <?xml version="1.0" encoding="UTF-8"?>
-            <kml xmlns="http://www.opengis.net/kml/2.2" xmlns:gx="http://www.google.com/kml/ext/2.2">
-            <Document>
-                <name>{doc_name}</name>
-                <gx:AnimatedUpdate>
-                    <gx:duration>0.0</gx:duration>
-                </gx:AnimatedUpdate>
-        ''')
-        
-        kml_footer = textwrap.dedent('''\
-            </Document>
-            </kml>
-        ''')
-        
-        placemarks = ""
-        total_rows = len(df)
-        missing_azimuth_count = 0
-        missing_distance_count = 0
-        
-        for idx, (_, row) in enumerate(df.iterrows()):
-            if idx % 10 == 0:
-                progress = 30 + int((idx / total_rows) * 50)
+        out.write(KML_HEADER_TPL.format(doc_name=doc_name))
+        out.write(self._shared_styles)
+        
+        # Resolve columns once and work on plain arrays, keeping only rows with coordinates
+        columns = _resolve_columns(df, COLUMN_ALIASES)
+        df, lat_arr, lon_arr, row_numbers = _rows_with_coordinates(
+            df, _numeric_column(df, columns['lat']), _numeric_column(df, columns['lon']))
+        total_rows = len(row_numbers)
+        kml_timestamps, display_labels = self.parse_timestamp_column(df, columns['timestamp'])
+        azimuth_arr = _numeric_column(df, columns['azimuth'])
+        distance_arr = _numeric_column(df, columns['distance'])
+        
+        # Missing-value masks, computed once per column
+        has_azimuth_mask = ~np.isnan(azimuth_arr)
+        has_distance_mask = ~np.isnan(distance_arr)
+        missing_azimuth_count = int(np.count_nonzero(~has_azimuth_mask))
+        missing_distance_count = int(np.count_nonzero(~has_distance_mask))
+        
+        # Distance units are a setting, not a per-row value
+        units_per_mile = TA_UNITS_PER_MILE.get(self.settings.get('ta_distance_units', 'Meters'), 1609.34)
+        distance_miles_arr = distance_arr / units_per_mile  # whole column at once
+        
+        # Walk the columns in lockstep as plain Python lists (no per-row array indexing)
+        rows = zip(row_numbers, lat_arr.tolist(), lon_arr.tolist(), kml_timestamps, display_labels,
+                   has_azimuth_mask.tolist(), azimuth_arr.tolist(), has_distance_mask.tolist(), distance_miles_arr.tolist())
+        
+        last_progress = -1
+        for idx, (row_number, lat, lon, kml_timestamp, display_label,
+                  has_azimuth, azimuth, has_distance, distance_miles) in enumerate(rows):
+            # Signal only when the percentage changes (at most ~50 cross-thread emits)
+            progress = 30 + (idx * 50) // total_rows
+            if progress != last_progress:
+                last_progress = progress
                 self.progress.emit(progress)
             
-            lat = self.get_column_value(row, ['Latitude', 'lat', 'Lat'])
-            lon = self.get_column_value(row, ['Longitude', 'lon', 'Lon', 'Long'])
-            timestamp = self.get_column_value(row, ['Timestamp', 'Date & Time', 'DateTime', 'Time'])
-            azimuth = self.get_column_value(row, ['Azimuth', 'bearing', 'direction'])
-            distance = self.get_column_value(row, ['Distance', 'range', 'distance (m)', 'distance (meters)'])
-            
-            if pd.isna(lat) or pd.isna(lon):
-                continue
-            
             # Use timestamp if available, otherwise use a generic label
-            if pd.isna(timestamp):
-                timestamp = f"Entry {idx + 1}"
+            if display_label is None:
+                display_label = f"Entry {row_number}"
             
             # Determine visualization based on available data
-            has_azimuth = not pd.isna(azimuth)
-            has_distance = not pd.isna(distance)
-            
             if has_azimuth and has_distance:
                 # Case 1: Has both azimuth and distance - create combined tower/sector + distance arc visualization
-                distance_miles = self.convert_ta_distance_to_miles(distance, self.settings.get('ta_distance_units', 'Meters'))
-                placemarks += self.create_combined_sector_and_arc(lat, lon, azimuth, timestamp, distance_miles)
+                self.create_combined_sector_and_arc(out, lat, lon, azimuth, kml_timestamp, display_label, distance_miles)
                 
             elif has_azimuth and not has_distance:
                 # Case 2: Has azimuth but missing distance - create directional wedge
-                missing_distance_count += 1
-                placemarks += self.create_sector_placemark(lat, lon, azimuth, timestamp)
+                self.create_sector_placemark(out, lat, lon, azimuth, kml_timestamp, display_label)
                 
             elif not has_azimuth and has_distance:
                 # Case 3: Missing azimuth but has distance - create 360° circle at the distance
-                missing_azimuth_count += 1
-                distance_miles = self.convert_ta_distance_to_miles(distance, self.settings.get('ta_distance_units', 'Meters'))
-                placemarks += self.create_distance_circle(lat, lon, timestamp, distance_miles)
+                self.create_distance_circle(out, lat, lon, kml_timestamp, display_label, distance_miles)
                 
             else:
                 # Case 4: Missing both azimuth and distance - create 360° circle using shaded area length
-                missing_azimuth_count += 1
-                missing_distance_count += 1
-                placemarks += self.create_circle_placemark(lat, lon, timestamp)
+                self.create_circle_placemark(out, lat, lon, kml_timestamp, display_label)
         
         # Report missing data
         if missing_azimuth_count > 0:
@@ -205,170 +649,130 @@ class KMLGenerator(QThread):
         if missing_distance_count > 0:
             self.status_message.emit(f"⚠️ Distance from Tower Data: {missing_distance_count} points had no distance data - distance from tower not drawn")
 
-        return kml_header + placemarks + kml_footer
+        out.write(KML_FOOTER)
     
-    def generate_gps_kml(self, df):
-        """Generate KML for location point data"""
+    def generate_gps_kml(self, df, out):
+        """Generate KML for location point data, writing it to out"""
         # Use custom label if provided, otherwise default
         doc_name = self.settings.get('custom_label') or "Location Point Data"
         
-        kml_header = textwrap.dedent(f'''\
-            <?xml version="1.0" encoding="UTF-8"?>
-            <kml xmlns="http://www.opengis.net/kml/2.2" xmlns:gx="http://www.google.com/kml/ext/2.2">
-            <Document>
-                <name>{doc_name}</name>
-                <gx:AnimatedUpdate>
-                    <gx:duration>0.0</gx:duration>
-                </gx:AnimatedUpdate>
-        ''')
-        
-        kml_footer = textwrap.dedent('''\
-            </Document>
-            </kml>
-        ''')
-        
-        placemarks = ""
-        total_rows = len(df)
-        missing_accuracy_count = 0
-        
-        for idx, (_, row) in enumerate(df.iterrows()):
-            if idx % 10 == 0:
-                progress = 30 + int((idx / total_rows) * 50)
+        out.write(KML_HEADER_TPL.format(doc_name=doc_name))
+        out.write(self._shared_styles)
+        
+        # Resolve columns once and work on plain arrays, keeping only rows with coordinates
+        columns = _resolve_columns(df, COLUMN_ALIASES)
+        df, lat_arr, lon_arr, _ = _rows_with_coordinates(
+            df, _numeric_column(df, columns['lat']), _numeric_column(df, columns['lon']))
+        kml_timestamps, display_labels = self.parse_timestamp_column(df, columns['timestamp'])
+        accuracy_arr = _object_column(df, columns['accuracy'])
+        
+        # Points also need a timestamp; drop the rows without one
+        has_timestamp = [label is not None for label in display_labels]
+        timestamp_mask = np.array(has_timestamp, dtype=bool)
+        lat_arr, lon_arr, accuracy_arr = lat_arr[timestamp_mask], lon_arr[timestamp_mask], accuracy_arr[timestamp_mask]
+        kml_timestamps = list(compress(kml_timestamps, has_timestamp))
+        display_labels = list(compress(display_labels, has_timestamp))
+        total_rows = len(display_labels)
+        
+        # Missing-value mask, computed once for the column
+        has_accuracy = pd.notna(accuracy_arr)
+        missing_accuracy_count = int(np.count_nonzero(~has_accuracy))
+        
+        # Accuracy radii in miles for every row: the unit scale is resolved once, missing
+        # values use the configured default and non-numeric values a small fallback radius
+        default_accuracy = self.settings.get('default_accuracy', 100)
+        default_units = self.settings.get('gps_units', 'Meters')
+        miles_per_unit = GPS_MILES_PER_UNIT.get(default_units, 0.000621371)
+        radius_arr = pd.to_numeric(accuracy_arr, errors='coerce').astype(np.float64) * miles_per_unit
+        radius_arr[has_accuracy & np.isnan(radius_arr)] = FALLBACK_ACCURACY_MILES
+        radius_arr[~has_accuracy] = float(default_accuracy) * miles_per_unit
+        
+        # Walk the columns in lockstep as plain Python lists (no per-row array indexing)
+        rows = zip(lat_arr.tolist(), lon_arr.tolist(), kml_timestamps, display_labels, radius_arr.tolist())
+        
+        last_progress = -1
+        for idx, (lat, lon, kml_timestamp, display_label, radius_miles) in enumerate(rows):
+            # Signal only when the percentage changes (at most ~50 cross-thread emits)
+            progress = 30 + (idx * 50) // total_rows
+            if progress != last_progress:
+                last_progress = progress
                 self.progress.emit(progress)
             
-            lat = self.get_column_value(row, ['Latitude', 'lat', 'Lat'])
-            lon = self.get_column_value(row, ['Longitude', 'lon', 'Lon', 'Long'])
-            timestamp = self.get_column_value(row, ['Timestamp', 'Date & Time', 'DateTime', 'Time'])
-            gps_accuracy = self.get_column_value(row, ['GPS Accuracy', 'Accuracy', 'gps_accuracy', 'accuracy'])
-            
-            if pd.isna(lat) or pd.isna(lon) or pd.isna(timestamp):
-                continue
-            
-            # Convert location point accuracy to miles for consistent circle size
-            if pd.isna(gps_accuracy):
-                missing_accuracy_count += 1
-                # Use configurable default radius from settings with proper units
-                default_accuracy = self.settings.get('default_accuracy', 100)
-                default_units = self.settings.get('gps_units', 'Meters')
-                radius_miles = self.convert_gps_accuracy_to_miles(default_accuracy, default_units)
-            else:
-                radius_miles = self.convert_gps_accuracy_to_miles(gps_accuracy, self.settings.get('gps_units', 'Meters'))
-            
             # Create location point accuracy circle
-            placemarks += self.create_gps_accuracy_circle(lat, lon, timestamp, radius_miles)
+            self.create_gps_accuracy_circle(out, lat, lon, kml_timestamp, display_label, radius_miles)
         
         # Report missing accuracy data
         if missing_accuracy_count > 0:
-            default_accuracy = self.settings.get('default_accuracy', 100)
-            default_units = self.settings.get('gps_units', 'Meters')
             self.status_message.emit(f"⚠️ Location Point Data: {missing_accuracy_count} points had no accuracy data - used {default_accuracy} {default_units.lower()} default radius")
         
-        return kml_header + placemarks + kml_footer
-    
-    def convert_gps_accuracy_to_miles(self, accuracy_value, units):
-        """Convert location point accuracy from various units to miles"""
-        try:
-            accuracy_float = float(accuracy_value)
-            
-            if units == "Meters":
-                return accuracy_float * 0.000621371  # meters to miles
-            elif units == "Feet":
-                return accuracy_float * 0.000189394  # feet to miles
-            elif units == "Miles":
-                return accuracy_float  # already in miles
-            elif units == "Kilometers":
-                return accuracy_float * 0.621371  # kilometers to miles
-            else:
-                # Default to meters if unknown unit
-                return accuracy_float * 0.000621371
-        except (ValueError, TypeError):
-            # If conversion fails, return a small default radius (10 meters in miles)
-            return 10 * 0.000621371
+        out.write(KML_FOOTER)
     
-    def create_gps_accuracy_circle(self, lat, lon, timestamp, radius_miles):
+    def create_gps_accuracy_circle(self, out, lat, lon, kml_timestamp, display_label, radius_miles):
         """Create a location point accuracy circle using the location point color"""
-        kml_timestamp, display_label = self.parse_timestamp_to_kml(timestamp)
-        
         # Create folder to group circle and timestamp label
-        placemark = textwrap.dedent(f'''\
-            <Folder>
-                <name>{display_label}</name>
-        ''')
+        out.write(FOLDER_OPEN_TPL.format(name=display_label))
         
         # Add timestamp if successfully interpreted
-        placemark += self.create_time_element(kml_timestamp)
+        out.write(self.create_time_element(kml_timestamp))
         
         # 1. Create location point accuracy circle
-        placemark += textwrap.dedent(f'''\
-                <Placemark>
-                    <name>{display_label} Location Point Circle</name>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <LineStyle>
-                            <color>{self.settings['gps_color']}</color>
-                            <width>2</width>
-                        </LineStyle>
-                        <PolyStyle>
-                            <color>4d{self.settings['gps_color'][2:]}</color>
-                        </PolyStyle>
-                    </Style>
-                    <Polygon>
-                        <outerBoundaryIs>
-                            <LinearRing>
-                                <coordinates>
-        ''')
+        out.write(PLACEMARK_OPEN_TPL.format(name=f"{display_label} Location Point Circle"))
         
-        # Generate circle points
-        for i in range(37):  # 36 points + close the loop
-            angle = i * 10  # Every 10 degrees
-            circle_lat, circle_lon = self.destination_point(lat, lon, angle, radius_miles)
-            placemark += f"                    {circle_lon},{circle_lat},0\n"
-        
-        placemark += textwrap.dedent('''\
-                                </coordinates>
-                            </LinearRing>
-                        </outerBoundaryIs>
-                    </Polygon>
-                </Placemark>
-        ''')
+        out.write(self.create_time_element(kml_timestamp, "            "))
+        
+        out.write(GPS_CIRCLE_STYLE)
+        
+        # Generate circle points (every 10 degrees, 36 points + close the loop), 6 decimals (~10 cm)
+        circle_lats, circle_lons = self.circle_points(lat, lon, radius_miles)
+        out.write(_coordinate_block(circle_lats, circle_lons, "                    "))
+        
+        out.write(GPS_CIRCLE_END)
         
         # 2. Add invisible center point label to show timestamp
-        placemark += textwrap.dedent(f'''\
-                <Placemark>
-                    <name>{display_label}</name>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <IconStyle>
-                            <scale>0</scale>
-                        </IconStyle>
-                        <LabelStyle>
-                            <color>ffffffff</color>
-                            <scale>0.8</scale>
-                        </LabelStyle>
-                    </Style>
-                    <Point>
-                        <coordinates>{lon},{lat},0</coordinates>
-                    </Point>
-                </Placemark>
-            </Folder>
-        ''')
-        
-        return placemark
+        out.write(PLACEMARK_OPEN_TPL.format(name=display_label))
+        
+        out.write(self.create_time_element(kml_timestamp, "            "))
+        
+        out.write(LABEL_POINT_FOLDER_END_TPL.format(lon=lon, lat=lat))
     
-    def get_column_value(self, row, possible_names):
-        """Get value from row using flexible column naming"""
-        for name in possible_names:
-            if name in row.index and not pd.isna(row[name]):
-                return row[name]
-        return None
+    def parse_timestamp_column(self, df, col):
+        """Parse a whole timestamp column; returns (kml_timestamps, display_labels) lists, None where missing"""
+        total_rows = len(df)
+        kml_timestamps = [None] * total_rows
+        display_labels = [None] * total_rows
+        if col is None:
+            return kml_timestamps, display_labels
+        
+        series = df[col]
+        present = series.notna().to_numpy()
+        
+        # Vectorized parse for the common cases: real datetimes, Excel serials, and ISO strings
+        if pd.api.types.is_datetime64_any_dtype(series):
+            parsed = series.dt.tz_localize(None) if series.dt.tz is not None else series
+        elif pd.api.types.is_numeric_dtype(series):
+            serials = series.where((series > 1) & (series < 50000))
+            parsed = pd.to_datetime(serials, unit='D', origin=EXCEL_EPOCH).dt.round('us')
+        else:
+            parsed = pd.to_datetime(series, format='%Y-%m-%d %H:%M:%S', errors='coerce')
+        
+        parsed_mask = parsed.notna().to_numpy()
+        parsed_kml = parsed.dt.strftime('%Y-%m-%dT%H:%M:%SZ').to_numpy(dtype=object)
+        parsed_display = parsed.dt.strftime('%Y-%m-%d %H:%M:%S').to_numpy(dtype=object)
+        
+        # Everything else goes through the regex parser, once per distinct value
+        values = series.to_numpy(dtype=object)
+        fallback = {}
+        for idx in range(total_rows):
+            if parsed_mask[idx]:
+                kml_timestamps[idx] = parsed_kml[idx]
+                display_labels[idx] = parsed_display[idx]
+            elif present[idx]:
+                value = values[idx]
+                if value not in fallback:
+                    fallback[value] = self.parse_timestamp_to_kml(value)
+                kml_timestamps[idx], display_labels[idx] = fallback[value]
+        
+        return kml_timestamps, display_labels
     
     def parse_timestamp_to_kml(self, timestamp_str):
         """Parse various timestamp formats and convert to KML-compatible format"""
@@ -378,140 +782,86 @@ class KMLGenerator(QThread):
         timestamp_str = str(timestamp_str).strip()
         
         # Try Excel serial date format first (numeric value like 45696.7637037037)
-        try:
+        if _LOOKS_NUMERIC_RE.match(timestamp_str):
             timestamp_float = float(timestamp_str)
-            # Excel serial dates are stored as days since 1900-01-01
+            # Excel serial dates count days from 1899-12-30 (which absorbs Excel's Feb 29, 1900 bug)
             # Check if it's a reasonable Excel serial (between 1 and ~50000, which covers years 1900-2037)
             if 1 < timestamp_float < 50000:
-                excel_epoch = datetime(1900, 1, 1)
-                # Excel has a leap year bug - day 60 doesn't exist (Feb 29, 1900)
-                days_offset = int(timestamp_float)
-                if days_offset > 59:  # After the non-existent Feb 29, 1900
-                    days_offset -= 1
-                fractional_day = timestamp_float - int(timestamp_float)
-                dt = excel_epoch + timedelta(days=days_offset, seconds=fractional_day * 86400)
+                dt = EXCEL_EPOCH + timedelta(days=timestamp_float)
                 kml_timestamp = dt.strftime('%Y-%m-%dT%H:%M:%SZ')
                 display_label = dt.strftime('%Y-%m-%d %H:%M:%S')
                 return kml_timestamp, display_label
-        except (ValueError, OverflowError):
-            pass
         
         # Strip timezone info from timestamps (e.g., "(GMT -4)", "(GMT+0)", "EST", "UTC")
-        # Remove patterns like (GMT±X), (UTC±X), timezone abbreviations at end
-        timestamp_str_clean = re.sub(r'\s*\([^)]*GMT[^)]*\)', '', timestamp_str)  # (GMT -4) style
-        timestamp_str_clean = re.sub(r'\s*\([^)]*UTC[^)]*\)', '', timestamp_str_clean)  # (UTC±X) style
-        timestamp_str_clean = re.sub(r'\s+[A-Z]{3,4}(?:\s|$)', ' ', timestamp_str_clean)  # EST, UTC, GMT suffix
+        timestamp_str_clean = _TS_CLEAN_GMT.sub('', timestamp_str)
+        timestamp_str_clean = _TS_CLEAN_UTC.sub('', timestamp_str_clean)
+        timestamp_str_clean = _TS_CLEAN_TZ.sub(' ', timestamp_str_clean)
         timestamp_str_clean = timestamp_str_clean.strip()
         
         # Strip milliseconds and microseconds (e.g., "2025-02-11 11:06:07.557" -> "2025-02-11 11:06:07")
-        timestamp_str_clean = re.sub(r'(\d{2}):(\d{2}):(\d{2})\.\d+', r'\1:\2:\3', timestamp_str_clean)
-        
-        # Common timestamp patterns
-        patterns = [
-            # ISO format variations
-            r'(\d{4})-(\d{1,2})-(\d{1,2})[T\s](\d{1,2}):(\d{1,2}):(\d{1,2})',
-            r'(\d{4})-(\d{1,2})-(\d{1,2})[T\s](\d{1,2}):(\d{1,2})',
-            r'(\d{4})-(\d{1,2})-(\d{1,2})',
-            # ISO forward-slash format (2025/02/03 18:36:04)
-            r'(\d{4})/(\d{1,2})/(\d{1,2})[T\s](\d{1,2}):(\d{1,2}):(\d{1,2})',
-            r'(\d{4})/(\d{1,2})/(\d{1,2})[T\s](\d{1,2}):(\d{1,2})',
-            r'(\d{4})/(\d{1,2})/(\d{1,2})',
-            # US format variations (with 4-digit years)
-            r'(\d{1,2})/(\d{1,2})/(\d{4})[T\s](\d{1,2}):(\d{1,2}):(\d{1,2})',
-            r'(\d{1,2})/(\d{1,2})/(\d{4})[T\s](\d{1,2}):(\d{1,2})',
-            r'(\d{1,2})/(\d{1,2})/(\d{4})',
-            # US format with 2-digit years (07/30/24 13:00:20)
-            r'(\d{1,2})/(\d{1,2})/(\d{2})[T\s](\d{1,2}):(\d{1,2}):(\d{1,2})',
-            r'(\d{1,2})/(\d{1,2})/(\d{2})[T\s](\d{1,2}):(\d{1,2})',
-            r'(\d{1,2})/(\d{1,2})/(\d{2})',
-            # European format variations (DD.MM.YYYY)
-            r'(\d{1,2})\.(\d{1,2})\.(\d{4})[T\s](\d{1,2}):(\d{1,2}):(\d{1,2})',
-            r'(\d{1,2})\.(\d{1,2})\.(\d{4})[T\s](\d{1,2}):(\d{1,2})',
-            r'(\d{1,2})\.(\d{1,2})\.(\d{4})',
-            # Time-only patterns (use today's date)
-            r'(\d{1,2}):(\d{1,2}):(\d{1,2})\s*([APap][Mm])?',
-            r'(\d{1,2}):(\d{1,2})\s*([APap][Mm])?',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, timestamp_str_clean)
-            if match:
-                groups = match.groups()
-                
-                try:
-                    # Check if this is a time-only pattern
-                    if ':' in timestamp_str_clean and not any(char in timestamp_str_clean for char in ['/', '-', '.']):
-                        # Time-only format - use today's date
-                        hour = int(groups[0])
-                        minute = int(groups[1])
-                        second = int(groups[2]) if len(groups) > 2 and groups[2] else 0
-                        
-                        # Handle AM/PM
-                        is_time_only = True
-                        if len(groups) > 2 and groups[-1] and groups[-1].lower() in ['pm', 'am']:
-                            if groups[-1].lower() == 'pm' and hour != 12:
-                                hour += 12
-                            elif groups[-1].lower() == 'am' and hour == 12:
-                                hour = 0
-                        
-                        # Use today's date for time-only entries
-                        today = datetime.now()
-                        dt = datetime(today.year, today.month, today.day, hour, minute, second)
-                        is_time_only = True
-                        
-                    else:
-                        is_time_only = False
-                        # Handle different date formats
-                        if '/' in timestamp_str_clean:  # US or ISO forward-slash format MM/DD/YYYY or YYYY/MM/DD
-                            # Determine if it's US (MM/DD/YYYY) or ISO (YYYY/MM/DD) based on first number
-                            first_num = int(groups[0])
-                            if first_num > 31:  # Must be YYYY, ISO format
-                                year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
-                            else:  # US format MM/DD/YYYY
-                                month, day, year = int(groups[0]), int(groups[1]), int(groups[2])
-                        elif '.' in timestamp_str_clean:  # European format DD.MM.YYYY
-                            day, month, year = int(groups[0]), int(groups[1]), int(groups[2])
-                        else:  # ISO format YYYY-MM-DD
-                            year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
-                        
-                        # Handle 2-digit years (convert to 4-digit)
-                        if year < 100:
-                            # Assume 00-30 is 2000-2030, 31-99 is 1931-1999
-                            year = 2000 + year if year <= 30 else 1900 + year
-                        
-                        # Handle time if present
-                        hour = int(groups[3]) if len(groups) > 3 else 0
-                        minute = int(groups[4]) if len(groups) > 4 else 0
-                        second = int(groups[5]) if len(groups) > 5 else 0
-                        
-                        # Create datetime object
-                        dt = datetime(year, month, day, hour, minute, second)
+        timestamp_str_clean = _TS_CLEAN_MS.sub(r'\1:\2:\3', timestamp_str_clean)
+        
+        for pattern, kind in _TS_PATTERNS:
+            match = pattern.search(timestamp_str_clean)
+            if not match:
+                continue
+            groups = match.groups()
+            
+            try:
+                if kind == 'time':
+                    # Time-only format - use today's date
+                    hour, minute = int(groups[0]), int(groups[1])
+                    second = int(groups[2]) if groups[2] else 0
+                    meridiem = (groups[3] or '').lower()
                     
-                    # Format for KML (ISO 8601)
-                    kml_timestamp = dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+                    # Handle AM/PM
+                    if meridiem == 'pm' and hour != 12:
+                        hour += 12
+                    elif meridiem == 'am' and hour == 12:
+                        hour = 0
                     
-                    # Create display label - show only time for time-only entries
-                    if is_time_only:
-                        # For time-only entries, show just the time in a clean format
-                        if len(groups) > 3 and groups[-1] and groups[-1].lower() in ['pm', 'am']:
-                            # Keep AM/PM format if it was in the original
-                            display_label = dt.strftime('%I:%M:%S %p').lstrip('0')
-                        else:
-                            # Use 24-hour format
-                            display_label = dt.strftime('%H:%M:%S')
+                    today = datetime.now()
+                    dt = datetime(today.year, today.month, today.day, hour, minute, second)
+                    
+                    # Show just the time, keeping AM/PM if it was in the original
+                    if meridiem:
+                        display_label = dt.strftime('%I:%M:%S %p').lstrip('0')
                     else:
-                        # For full timestamps, show date and time
-                        display_label = dt.strftime('%Y-%m-%d %H:%M:%S')
+                        display_label = dt.strftime('%H:%M:%S')
+                else:
+                    # Date field order comes from the pattern tag
+                    if kind == 'ymd':
+                        year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
+                    elif kind == 'mdy':
+                        month, day, year = int(groups[0]), int(groups[1]), int(groups[2])
+                    else:  # 'dmy'
+                        day, month, year = int(groups[0]), int(groups[1]), int(groups[2])
+                    
+                    # Handle 2-digit years (convert to 4-digit)
+                    if year < 100:
+                        # Assume 00-30 is 2000-2030, 31-99 is 1931-1999
+                        year = 2000 + year if year <= 30 else 1900 + year
                     
-                    return kml_timestamp, display_label
+                    # Handle time if present
+                    hour = int(groups[3]) if len(groups) > 3 else 0
+                    minute = int(groups[4]) if len(groups) > 4 else 0
+                    second = int(groups[5]) if len(groups) > 5 else 0
                     
-                except (ValueError, OverflowError):
-                    continue
+                    dt = datetime(year, month, day, hour, minute, second)
+                    display_label = dt.strftime('%Y-%m-%d %H:%M:%S')
+                
+                # Format for KML (ISO 8601)
+                return dt.strftime('%Y-%m-%dT%H:%M:%SZ'), display_label
+                
+            except (ValueError, OverflowError):
+                continue
         
         # If no pattern matches, return None for KML timestamp but keep original as label
         return None, timestamp_str
     
-    def calculate_end_timestamp(self, kml_timestamp, duration_minutes):
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def calculate_end_timestamp(kml_timestamp, duration_minutes):
         """Calculate end timestamp by adding duration to the begin timestamp"""
         try:
             # Parse the KML timestamp (ISO format: YYYY-MM-DDTHH:MM:SS or YYYY-MM-DD)
@@ -538,504 +888,189 @@ class KMLGenerator(QThread):
     
     def create_time_element(self, kml_timestamp, indent="        "):
         """Create a TimeSpan element with begin and end times for duration-based animation"""
-        if not kml_timestamp or not self.settings.get('enable_time_animation', True):
+        if not kml_timestamp or not self._animate:
             return ""
         
+        # Every placemark in a folder repeats the same element, so build each one once
+        key = (kml_timestamp, indent)
+        element = self._time_elem_cache.get(key)
+        if element is not None:
+            return element
+        
         # Calculate end time based on duration setting
-        duration_minutes = self.settings.get('duration_minutes', 30)
-        end_timestamp = self.calculate_end_timestamp(kml_timestamp, duration_minutes)
+        end_timestamp = self.calculate_end_timestamp(kml_timestamp, self._duration_minutes)
         
         if end_timestamp:
             # Use gx:TimeSpan with both begin and end for duration-based visibility
-            return f"{indent}<gx:TimeSpan><begin>{kml_timestamp}</begin><end>{end_timestamp}</end></gx:TimeSpan>\n"
+            element = f"{indent}<gx:TimeSpan><begin>{kml_timestamp}</begin><end>{end_timestamp}</end></gx:TimeSpan>\n"
         else:
             # Fallback to begin-only if end calculation fails
-            return f"{indent}<gx:TimeSpan><begin>{kml_timestamp}</begin></gx:TimeSpan>\n"
+            element = f"{indent}<gx:TimeSpan><begin>{kml_timestamp}</begin></gx:TimeSpan>\n"
+        self._time_elem_cache[key] = element
+        return element
+    
+    def sector_geometry(self, lat, lon, azimuth):
+        """Shaded-area arc block and leg end points for a sector, cached per (lat, lon, azimuth)"""
+        key = (lat, lon, azimuth)
+        geometry = self._sector_cache.get(key)
+        if geometry is None:
+            # Arc points for shaded area, 6 decimals (~10 cm)
+            arc_lats, arc_lons = self.sector_points(lat, lon, azimuth, self._shaded_len)
+            arc_block = _coordinate_block(arc_lats, arc_lons, "                ")
+            left_end = destination_point(lat, lon, azimuth - self._half_spread, self._leg_len)
+            right_end = destination_point(lat, lon, azimuth + self._half_spread, self._leg_len)
+            geometry = (arc_block, left_end, right_end)
+            self._sector_cache[key] = geometry
+        return geometry
+    
+    def circle_block(self, lat, lon, radius_miles, indent):
+        """Closed circle coordinates block around a tower, cached per (lat, lon, radius, indent)"""
+        key = (lat, lon, radius_miles, indent)
+        block = self._circle_cache.get(key)
+        if block is None:
+            circle_lats, circle_lons = self.circle_points(lat, lon, radius_miles)
+            block = _coordinate_block(circle_lats, circle_lons, indent)
+            self._circle_cache[key] = block
+        return block
     
-    def create_sector_placemark(self, lat, lon, azimuth, timestamp):
+    def create_sector_placemark(self, out, lat, lon, azimuth, kml_timestamp, display_label):
         """Create a sector wedge placemark with extended directional lines (SWGDE style)"""
-        kml_timestamp, display_label = self.parse_timestamp_to_kml(timestamp)
-        
-        start_angle = azimuth - self.settings['azimuth_spread'] / 2
-        end_angle = azimuth + self.settings['azimuth_spread'] / 2
+        # Towers repeat across rows, so the geometry is usually already built
+        arc_block, (left_lat, left_lon), (right_lat, right_lon) = self.sector_geometry(lat, lon, azimuth)
         
         # Create folder to group sector and extended lines
-        placemark = textwrap.dedent(f'''\
-            <Folder>
-                <name>{display_label}</name>
-        ''')
+        out.write(FOLDER_OPEN_TPL.format(name=display_label))
         
         # Add timestamp if successfully interpreted and time animation is enabled
-        placemark += self.create_time_element(kml_timestamp)
+        out.write(self.create_time_element(kml_timestamp))
         
         # 1. Create the shaded sector wedge
-        placemark += textwrap.dedent(f'''\
-                <Placemark>
-                    <name>{display_label} Shaded Area</name>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <LineStyle><color>{self.settings['leg_color']}</color><width>1</width></LineStyle>
-                        <PolyStyle><color>7d{self.settings['shaded_color'][2:]}</color></PolyStyle>
-                    </Style>
-                    <Polygon>
-                        <outerBoundaryIs><LinearRing><coordinates>
-                            {lon},{lat},0
-        ''')
-        
-        # Generate arc points for shaded area
-        for i in range(self.settings['num_points'] + 1):
-            angle = start_angle + (end_angle - start_angle) * i / self.settings['num_points']
-            arc_lat, arc_lon = self.destination_point(lat, lon, angle, self.settings['shaded_area_length'])
-            placemark += f"                {arc_lon},{arc_lat},0\n"
-        
-        placemark += f"                {lon},{lat},0\n"
-        placemark += textwrap.dedent('''\
-                        </coordinates></LinearRing></outerBoundaryIs>
-                    </Polygon>
-                </Placemark>
-        ''')
+        out.write(PLACEMARK_OPEN_TPL.format(name=f"{display_label} Shaded Area"))
+        
+        out.write(self.create_time_element(kml_timestamp, "            "))
+        
+        out.write(SECTOR_STYLE_TPL.format(lon=lon, lat=lat))
+        
+        out.write(arc_block)
+        out.write(f"                {lon:.6f},{lat:.6f},0\n")
+        out.write(POLYGON_END)
         
         # 2. Create center point label (no icon, just show timestamp)
-        placemark += textwrap.dedent(f'''\
-                <Placemark>
-                    <name>{display_label}</name>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <IconStyle>
-                            <scale>0</scale>
-                        </IconStyle>
-                        <LabelStyle>
-                            <color>ffffffff</color>
-                            <scale>0.8</scale>
-                        </LabelStyle>
-                    </Style>
-                    <Point>
-                        <coordinates>{lon},{lat},0</coordinates>
-                    </Point>
-                </Placemark>
-        ''')
+        out.write(PLACEMARK_OPEN_TPL.format(name=display_label))
         
-        # 3. Create extended directional lines (legs)
-        leg_length = self.settings['leg_length']
+        out.write(self.create_time_element(kml_timestamp, "            "))
         
+        out.write(LABEL_POINT_TPL.format(lon=lon, lat=lat))
+        
+        # 3. Create extended directional lines (legs)
         # Left directional line
-        left_lat, left_lon = self.destination_point(lat, lon, start_angle, leg_length)
-        placemark += textwrap.dedent(f'''\
-                <Placemark>
-                    <name>{display_label} Left Leg</name>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <LineStyle><color>{self.settings['leg_color']}</color><width>2</width></LineStyle>
-                    </Style>
-                    <LineString>
-                        <coordinates>
-                            {lon},{lat},0
-                            {left_lon},{left_lat},0
-                        </coordinates>
-                    </LineString>
-                </Placemark>
-        ''')
+        out.write(PLACEMARK_OPEN_TPL.format(name=f"{display_label} Left Leg"))
+        
+        out.write(self.create_time_element(kml_timestamp, "            "))
+        
+        out.write(LEG_TPL.format(lon=lon, lat=lat, end_lon=left_lon, end_lat=left_lat))
         
         # Right directional line
-        right_lat, right_lon = self.destination_point(lat, lon, end_angle, leg_length)
-        placemark += textwrap.dedent(f'''\
-                <Placemark>
-                    <name>{display_label} Right Leg</name>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <LineStyle><color>{self.settings['leg_color']}</color><width>2</width></LineStyle>
-                    </Style>
-                    <LineString>
-                        <coordinates>
-                            {lon},{lat},0
-                            {right_lon},{right_lat},0
-                        </coordinates>
-                    </LineString>
-                </Placemark>
-            </Folder>
-        ''')
-        
-        return placemark
+        out.write(PLACEMARK_OPEN_TPL.format(name=f"{display_label} Right Leg"))
+        
+        out.write(self.create_time_element(kml_timestamp, "            "))
+        
+        out.write(LEG_FOLDER_END_TPL.format(lon=lon, lat=lat, end_lon=right_lon, end_lat=right_lat))
     
-    def create_circle_placemark(self, lat, lon, timestamp):
+    def create_circle_placemark(self, out, lat, lon, kml_timestamp, display_label):
         """Create a circular visualization placemark"""
-        kml_timestamp, display_label = self.parse_timestamp_to_kml(timestamp)
-        
         # Create folder to group circle and center label
-        placemark = textwrap.dedent(f'''\
-            <Folder>
-                <name>{display_label}</name>
-        ''')
+        out.write(FOLDER_OPEN_TPL.format(name=display_label))
         
         # Add timestamp if successfully parsed and time animation is enabled
-        placemark += self.create_time_element(kml_timestamp)
+        out.write(self.create_time_element(kml_timestamp))
         
         # 1. Create the circle
-        placemark += textwrap.dedent(f'''\
-                <Placemark>
-                    <name>{display_label} Visualization Area</name>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <LineStyle><color>{self.settings['leg_color']}</color><width>1</width></LineStyle>
-                        <PolyStyle><color>7d{self.settings['shaded_color'][2:]}</color></PolyStyle>
-                    </Style>
-                    <Polygon>
-                        <outerBoundaryIs><LinearRing><coordinates>
-        ''')
+        out.write(PLACEMARK_OPEN_TPL.format(name=f"{display_label} Visualization Area"))
         
-        # Generate circle points
-        for i in range(37):  # 0 to 360 degrees, every 10 degrees
-            angle = i * 10
-            arc_lat, arc_lon = self.destination_point(lat, lon, angle, self.settings['shaded_area_length'])
-            placemark += f"                            {arc_lon},{arc_lat},0\n"
-        
-        placemark += textwrap.dedent(f'''\
-                        </coordinates></LinearRing></outerBoundaryIs>
-                    </Polygon>
-                </Placemark>
-        
-                <Placemark>
-                    <name>{display_label}</name>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <IconStyle>
-                            <scale>0</scale>
-                        </IconStyle>
-                        <LabelStyle>
-                            <color>ffffffff</color>
-                            <scale>0.8</scale>
-                        </LabelStyle>
-                    </Style>
-                    <Point>
-                        <coordinates>{lon},{lat},0</coordinates>
-                    </Point>
-                </Placemark>
-            </Folder>
-        ''')
-        
-        return placemark
+        out.write(self.create_time_element(kml_timestamp, "            "))
+        
+        out.write(CIRCLE_STYLE)
+        
+        # Generate circle points (0 to 360 degrees, every 10 degrees)
+        out.write(self.circle_block(lat, lon, self._shaded_len, "                            "))
+        
+        out.write(POLYGON_END)
+        out.write(SPACED_PLACEMARK_OPEN_TPL.format(name=display_label))
+        
+        out.write(self.create_time_element(kml_timestamp, "            "))
+        
+        out.write(LABEL_POINT_FOLDER_END_TPL.format(lon=lon, lat=lat))
     
-    def create_uncertainty_circle(self, lat, lon, timestamp, radius_miles):
+    def create_uncertainty_circle(self, out, lat, lon, kml_timestamp, display_label, radius_miles):
         """Create uncertainty circle for distance from tower data"""
-        kml_timestamp, display_label = self.parse_timestamp_to_kml(timestamp)
-        
-        placemark = textwrap.dedent(f'''\
-            <Placemark>
-                <name>{display_label} Uncertainty</name>
-        ''')
+        out.write(PLACEMARK_OPEN_TPL.format(name=f"{display_label} Uncertainty"))
         
         # Add timestamp if successfully interpreted and time animation is enabled
-        placemark += self.create_time_element(kml_timestamp)
+        out.write(self.create_time_element(kml_timestamp))
         
-        placemark += textwrap.dedent(f'''\
-                <Style>
-                    <LineStyle><color>{self.settings['ta_color']}</color><width>1</width></LineStyle>
-                    <PolyStyle><color>7d{self.settings['ta_color'][2:]}</color></PolyStyle>
-                </Style>
-                <Polygon>
-                    <outerBoundaryIs><LinearRing><coordinates>
-        ''')
+        out.write(self._uncertainty_style)
         
         # Generate circle points
-        for i in range(37):
-            angle = i * 10
-            arc_lat, arc_lon = self.destination_point(lat, lon, angle, radius_miles)
-            placemark += f"{arc_lon},{arc_lat},0\n"
-        
-        placemark += f"{lon},{lat},0\n"
-        placemark += textwrap.dedent('''\
-                    </coordinates></LinearRing></outerBoundaryIs>
-                </Polygon>
-            </Placemark>
-        ''')
-        
-        return placemark
+        out.write(self.circle_block(lat, lon, radius_miles, ""))
+        
+        out.write(f"{lon:.6f},{lat:.6f},0\n")
+        out.write(POLYGON_END)
     
-    def create_pin_placemark(self, lat, lon, name, color):
+    def create_pin_placemark(self, out, lat, lon, kml_timestamp, display_label, color):
         """Create a pin placemark"""
-        kml_timestamp, display_label = self.parse_timestamp_to_kml(name)
-        
-        placemark = textwrap.dedent(f'''\
-            <Placemark>
-                <name>{display_label}</name>
-        ''')
+        out.write(PLACEMARK_OPEN_TPL.format(name=display_label))
         
         # Add timestamp if successfully interpreted and time animation is enabled
-        placemark += self.create_time_element(kml_timestamp)
+        out.write(self.create_time_element(kml_timestamp))
         
-        placemark += textwrap.dedent(f'''\
-                <Style><IconStyle><color>{color}</color></IconStyle></Style>
-                <Point>
-                    <coordinates>{lon},{lat},0</coordinates>
-                </Point>
-            </Placemark>
-        ''')
-        
-        return placemark
+        out.write(PIN_TPL.format(color=color, lon=lon, lat=lat))
     
-    def create_combined_sector_and_arc(self, lat, lon, azimuth, timestamp, distance_miles):
+    def create_combined_sector_and_arc(self, out, lat, lon, azimuth, kml_timestamp, display_label, distance_miles):
         """Create combined tower/sector visualization with distance arc in a single folder"""
-        kml_timestamp, display_label = self.parse_timestamp_to_kml(timestamp)
+        # Shaded wedge and distance arc vertices share one bearing grid, so its sin/cos is computed once
+        bearings = np.radians(azimuth + self._sector_offsets)
+        sin_b, cos_b = np.sin(bearings), np.cos(bearings)
+        sector_lats, sector_lons = _destination_points_sc(lat, lon, sin_b, cos_b, self._shaded_len)
+        arc_lats, arc_lons = _destination_points_sc(lat, lon, sin_b, cos_b, distance_miles)
+        
+        # Directional leg end points at the sector edges
+        left_lat, left_lon = destination_point(lat, lon, azimuth - self._half_spread, self._leg_len)
+        right_lat, right_lon = destination_point(lat, lon, azimuth + self._half_spread, self._leg_len)
+        
+        # Folder with the wedge, both legs, the distance arc and the center label, in one render
+        out.write(COMBINED_SECTOR_AND_ARC_TPL.format(
+            display_label=display_label,
+            time=self.create_time_element(kml_timestamp),
+            child_time=self.create_time_element(kml_timestamp, "            "),
+            lat=lat, lon=lon, azimuth=_display_number(azimuth),
+            azimuth_spread=self._azimuth_spread, distance_miles=distance_miles,
+            sector_block=_coordinate_block(sector_lats, sector_lons, "                                    "),
+            arc_block=_coordinate_block(arc_lats, arc_lons, "                            "),
+            left_lat=left_lat, left_lon=left_lon, right_lat=right_lat, right_lon=right_lon,
+        ))
+    
+    def create_distance_circle(self, out, lat, lon, kml_timestamp, display_label, distance_miles):
+        """Create a circle at the distance from tower (when azimuth is missing)"""
+        # Create folder to group circle and center label
+        out.write(FOLDER_OPEN_TPL.format(name=f"{display_label} Distance Circle"))
         
-        # Get settings
-        azimuth_spread = self.settings.get('azimuth_spread', 120)
-        half_spread = azimuth_spread / 2
-        leg_length = self.settings.get('leg_length', 3.0)
-        shaded_area_length = self.settings.get('shaded_area_length', 1.0)
+        # Add timestamp if successfully interpreted and time animation is enabled
+        out.write(self.create_time_element(kml_timestamp))
         
-        # Calculate start and end angles for the sector
-        start_angle = azimuth - half_spread
-        end_angle = azimuth + half_spread
+        # Create the circle at the distance
+        out.write(PLACEMARK_OPEN_TPL.format(name=f"{display_label} Distance Circle ({distance_miles:.2f} mi)"))
         
-        # Create single folder for both sector and arc
-        placemark = textwrap.dedent(f'''\
-            <Folder>
-                <name>{display_label}</name>
-        ''')
+        out.write(self.create_time_element(kml_timestamp, "            "))
         
-        # Add timestamp for time animation
-        placemark += self.create_time_element(kml_timestamp)
+        out.write(DISTANCE_LINE_STYLE)
         
-        # 1. Create the shaded sector wedge
-        placemark += textwrap.dedent(f'''\
-                <Placemark>
-                    <name>{display_label} Tower Sector</name>
-                    <description>
-                        Tower: {lat:.6f}, {lon:.6f}
-                        Azimuth: {azimuth}°
-                        Sector Width: {azimuth_spread}°
-                        Distance: {distance_miles:.2f} miles
-                    </description>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <LineStyle><color>{self.settings['leg_color']}</color><width>1</width></LineStyle>
-                        <PolyStyle><color>7d{self.settings['shaded_color'][2:]}</color></PolyStyle>
-                    </Style>
-                    <Polygon>
-                        <outerBoundaryIs>
-                            <LinearRing>
-                                <coordinates>
-                                    {lon},{lat},0
-        ''')
-        
-        # Generate arc points for the sector wedge
-        num_points = self.settings.get('num_points', 20)
-        for i in range(num_points + 1):
-            angle = start_angle + (i / num_points) * azimuth_spread
-            arc_lat, arc_lon = self.destination_point(lat, lon, angle, shaded_area_length)
-            placemark += f"                                    {arc_lon},{arc_lat},0\n"
-        
-        placemark += textwrap.dedent(f'''\
-                                    {lon},{lat},0
-                                </coordinates>
-                            </LinearRing>
-                        </outerBoundaryIs>
-                    </Polygon>
-                </Placemark>
-        ''')
-        
-        # 2. Create left directional line
-        left_lat, left_lon = self.destination_point(lat, lon, start_angle, leg_length)
-        placemark += textwrap.dedent(f'''\
-                <Placemark>
-                    <name>{display_label} Left Leg</name>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <LineStyle><color>{self.settings['leg_color']}</color><width>2</width></LineStyle>
-                    </Style>
-                    <LineString>
-                        <coordinates>
-                            {lon},{lat},0
-                            {left_lon},{left_lat},0
-                        </coordinates>
-                    </LineString>
-                </Placemark>
-        ''')
-        
-        # 3. Create right directional line
-        right_lat, right_lon = self.destination_point(lat, lon, end_angle, leg_length)
-        placemark += textwrap.dedent(f'''\
-                <Placemark>
-                    <name>{display_label} Right Leg</name>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <LineStyle><color>{self.settings['leg_color']}</color><width>2</width></LineStyle>
-                    </Style>
-                    <LineString>
-                        <coordinates>
-                            {lon},{lat},0
-                            {right_lon},{right_lat},0
-                        </coordinates>
-                    </LineString>
-                </Placemark>
-        ''')
-        
-        # 4. Create the distance arc
-        placemark += textwrap.dedent(f'''\
-                <Placemark>
-                    <name>{display_label} Distance Arc ({distance_miles:.2f} mi)</name>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <LineStyle><color>{self.settings['ta_color']}</color><width>3</width></LineStyle>
-                    </Style>
-                    <LineString>
-                        <coordinates>
-        ''')
-        
-        # Generate arc points for the distance arc
-        for i in range(num_points + 1):
-            angle = start_angle + (i / num_points) * azimuth_spread
-            arc_lat, arc_lon = self.destination_point(lat, lon, angle, distance_miles)
-            placemark += f"                            {arc_lon},{arc_lat},0\n"
-        
-        placemark += textwrap.dedent('''\
-                        </coordinates>
-                    </LineString>
-                </Placemark>
-        ''')
-        
-        # 5. Add invisible center point label to show timestamp
-        placemark += textwrap.dedent(f'''\
-                <Placemark>
-                    <name>{display_label}</name>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <IconStyle>
-                            <scale>0</scale>
-                        </IconStyle>
-                        <LabelStyle>
-                            <color>ffffffff</color>
-                            <scale>0.8</scale>
-                        </LabelStyle>
-                    </Style>
-                    <Point>
-                        <coordinates>{lon},{lat},0</coordinates>
-                    </Point>
-                </Placemark>
-            </Folder>
-        ''')
-        
-        return placemark
-    
-    def create_distance_circle(self, lat, lon, timestamp, distance_miles):
-        """Create a circle at the distance from tower (when azimuth is missing)"""
-        kml_timestamp, display_label = self.parse_timestamp_to_kml(timestamp)
+        # Generate circle points at the distance (0 to 360 degrees, every 10 degrees)
+        out.write(self.circle_block(lat, lon, distance_miles, "                            "))
         
-        # Create folder to group circle and center label
-        placemark = textwrap.dedent(f'''\
-            <Folder>
-                <name>{display_label} Distance Circle</name>
-        ''')
+        out.write(LINE_END)
+        out.write(SPACED_PLACEMARK_OPEN_TPL.format(name=display_label))
         
-        # Add timestamp if successfully interpreted and time animation is enabled
-        placemark += self.create_time_element(kml_timestamp)
+        out.write(self.create_time_element(kml_timestamp, "            "))
         
-        # Create the circle at the distance
-        placemark += textwrap.dedent(f'''\
-                <Placemark>
-                    <name>{display_label} Distance Circle ({distance_miles:.2f} mi)</name>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <LineStyle><color>{self.settings['ta_color']}</color><width>3</width></LineStyle>
-                    </Style>
-                    <LineString>
-                        <coordinates>
-        ''')
-        
-        # Generate circle points at the distance
-        for i in range(37):  # 0 to 360 degrees, every 10 degrees
-            angle = i * 10
-            arc_lat, arc_lon = self.destination_point(lat, lon, angle, distance_miles)
-            placemark += f"                            {arc_lon},{arc_lat},0\n"
-        
-        placemark += textwrap.dedent(f'''\
-                        </coordinates>
-                    </LineString>
-                </Placemark>
-        
-                <Placemark>
-                    <name>{display_label}</name>
-        ''')
-        
-        placemark += self.create_time_element(kml_timestamp, "            ")
-        
-        placemark += textwrap.dedent(f'''\
-                    <Style>
-                        <IconStyle>
-                            <scale>0</scale>
-                        </IconStyle>
-                        <LabelStyle>
-                            <color>ffffffff</color>
-                            <scale>0.8</scale>
-                        </LabelStyle>
-                    </Style>
-                    <Point>
-                        <coordinates>{lon},{lat},0</coordinates>
-                    </Point>
-                </Placemark>
-            </Folder>
-        ''')
-        
-        return placemark
-    
-    def convert_ta_distance_to_miles(self, distance, units):
-        """Convert distance from tower distance to miles based on user-selected units"""
-        if units == "Meters":
-            return distance / 1609.34  # meters to miles
-        elif units == "Feet":
-            return distance / 5280  # feet to miles
-        elif units == "Miles":
-            return distance  # already in miles
-        elif units == "Kilometers":
-            return distance / 1.60934  # kilometers to miles
-        else:
-            # Default to meters if unknown unit
-            return distance / 1609.34
+        out.write(LABEL_POINT_FOLDER_END_TPL.format(lon=lon, lat=lat))
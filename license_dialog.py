@@ -3,8 +3,9 @@ Open Source Location Data Visualizer - github.com/btc-git/OS-LOC-DAT-VIZ
 Licensed under the GNU General Public License v3.0 - see LICENSE file for details
 """
 
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QScrollArea, QWidget
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QPlainTextEdit
 from PyQt6.QtCore import Qt
+from functools import lru_cache
 from pathlib import Path
 
 class LicenseDialog(QDialog):
@@ -17,17 +18,15 @@ class LicenseDialog(QDialog):
 
 
         layout = QVBoxLayout(self)
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
-        # License label
-        license_text = self._read_license()
-        license_label = QLabel(license_text)
-        license_label.setWordWrap(True)
-        license_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        license_label.setStyleSheet("""
-            QLabel {
+        # License text (plain-text view lays out only the visible lines, and scrolls on its own)
+        license_view = QPlainTextEdit()
+        license_view.setReadOnly(True)
+        license_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        license_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
+        license_view.setPlainText(self._read_license())
+        license_view.setStyleSheet("""
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #cccccc;
                 border: 1px solid #444444;
@@ -37,8 +36,7 @@ class LicenseDialog(QDialog):
                 font-size: 10pt;
             }
         """)
-        scroll_area.setWidget(license_label)
-        layout.addWidget(scroll_area)
+        layout.addWidget(license_view)
 
         # Close button
         from PyQt6.QtWidgets import QHBoxLayout, QPushButton
@@ -66,8 +64,10 @@ class LicenseDialog(QDialog):
         button_layout.addStretch()
         layout.addLayout(button_layout)
 
-    def _read_license(self):
-        # Try to find LICENSE file in the same directory as the executable or script
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _read_license():
+        # Read once per process; try to find LICENSE file in the same directory as the executable or script
         possible_paths = [
             Path(__file__).parent / "LICENSE",
             Path(__file__).parent.parent / "LICENSE"
@@ -3,35 +3,374 @@ Open Source Location Data Visualizer - github.com/btc-git/OS-LOC-DAT-VIZ
 Licensed under the GNU General Public License v3.0 - see LICENSE file for details
 """
 
-import pandas as pd
-import subprocess
+import csv
+import os
+import re
+import shutil
 import sys
 from pathlib import Path
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QGridLayout, QPushButton, QLabel, QFileDialog, 
                              QSpinBox, QDoubleSpinBox, QRadioButton, QButtonGroup, 
-                             QTextEdit, QGroupBox, QColorDialog, QProgressBar, 
+                             QPlainTextEdit, QGroupBox, QColorDialog, QProgressBar, 
                              QMessageBox, QTabWidget, QCheckBox, QMenu, QComboBox, QLineEdit)
-from PyQt6.QtCore import Qt, QSettings
+from PyQt6.QtCore import Qt, QSettings, QSaveFile, QIODevice
 from PyQt6.QtGui import QFont, QColor, QIcon, QPixmap, QPainter, QPen
 
 from dialogs import DisclaimerDialog
 from widgets import DragDropWidget
-from kml_generator import KMLGenerator
+from columns import COLUMN_ALIASES
+
+# Header vocabulary per field, as sets for membership tests (the generator's own alias table)
+_HEADER_SETS = {field: frozenset(names) for field, names in COLUMN_ALIASES.items()}
+
+_MAIN_WINDOW_QSS = """
+QMainWindow {
+    background-color: #2b2b2b;
+    color: #ffffff;
+}
+QWidget {
+    background-color: #2b2b2b;
+    color: #ffffff;
+}
+QGroupBox {
+    font-weight: bold;
+    border: 2px solid #555555;
+    border-radius: 5px;
+    margin-top: 1ex;
+    padding-top: 10px;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+QPushButton {
+    background-color: #404040;
+    border: 1px solid #555555;
+    padding: 8px;
+    border-radius: 4px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #505050;
+}
+QPushButton:pressed {
+    background-color: #353535;
+}
+QPushButton:disabled {
+    background-color: #2b2b2b;
+    color: #666666;
+}
+QRadioButton::indicator {
+    width: 18px;
+    height: 18px;
+}
+QRadioButton::indicator::unchecked {
+    border: 2px solid #555555;
+    border-radius: 9px;
+    background-color: #2b2b2b;
+}
+QRadioButton::indicator::checked {
+    border: 2px solid #0078d4;
+    border-radius: 9px;
+    background-color: #0078d4;
+}
+QSpinBox, QDoubleSpinBox {
+    background-color: #404040;
+    border: 1px solid #555555;
+    padding: 4px;
+    border-radius: 4px;
+}
+QComboBox {
+    background-color: #404040;
+    border: 1px solid #555555;
+    padding: 4px;
+    border-radius: 4px;
+    min-height: 16px;
+}
+QComboBox::drop-down {
+    subcontrol-origin: padding;
+    subcontrol-position: top right;
+    width: 20px;
+    border-left-width: 1px;
+    border-left-color: #555555;
+    border-left-style: solid;
+    border-top-right-radius: 3px;
+    border-bottom-right-radius: 3px;
+    background-color: #505050;
+}
+QComboBox::down-arrow {
+    image: none;
+    border-left: 4px solid transparent;
+    border-right: 4px solid transparent;
+    border-top: 6px solid #ffffff;
+    width: 0px;
+    height: 0px;
+}
+QTabWidget::pane {
+    border: 1px solid #555555;
+    background-color: #2b2b2b;
+}
+QTabBar::tab {
+    background-color: #404040;
+    padding: 8px 12px;
+    margin-right: 2px;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+}
+QTabBar::tab:selected {
+    background-color: #0078d4;
+}
+QTabBar::tab:hover {
+    background-color: #505050;
+}
+QPlainTextEdit {
+    background-color: #1e1e1e;
+    border: 1px solid #555555;
+    border-radius: 4px;
+    padding: 4px;
+}
+QProgressBar {
+    border: 1px solid #555555;
+    border-radius: 4px;
+    text-align: center;
+}
+QProgressBar::chunk {
+    background-color: #0078d4;
+    border-radius: 3px;
+}
+QFrame {
+    border: none;
+}
+"""
+
+_TEMPLATE_BUTTON_QSS = """
+QPushButton {
+    background-color: #28a745;
+    color: white;
+    font-weight: bold;
+    padding: 6px 12px;
+    border-radius: 4px;
+    border: none;
+    margin-right: 8px;
+}
+QPushButton:hover {
+    background-color: #218838;
+}
+QPushButton:pressed {
+    background-color: #1e7e34;
+}
+"""
+
+_INFO_BUTTON_QSS = """
+QPushButton {
+    background-color: #0078d4;
+    color: white;
+    font-weight: bold;
+    padding: 6px 12px;
+    border-radius: 4px;
+    border: none;
+}
+QPushButton:hover {
+    background-color: #106ebe;
+}
+QPushButton:pressed {
+    background-color: #005a9e;
+}
+"""
+
+_FILE_GROUP_QSS = """
+QGroupBox { 
+    border: 2px solid #555555; 
+    border-radius: 8px; 
+    font-weight: bold; 
+    margin-top: 10px;
+    padding-top: 10px;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+"""
+
+_LABEL_INPUT_QSS = """
+QLineEdit {
+    padding: 6px;
+    border: 1px solid #555555;
+    border-radius: 4px;
+    background-color: #1e1e1e;
+    color: #ffffff;
+}
+QLineEdit:focus {
+    border: 1px solid #0078d4;
+}
+"""
+
+_GENERATE_BUTTON_QSS = """
+QPushButton {
+    font-size: 16px;
+    font-weight: bold;
+    background-color: #0078d4;
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 12px;
+}
+QPushButton:hover {
+    background-color: #106ebe;
+}
+QPushButton:pressed {
+    background-color: #005a9e;
+}
+QPushButton:disabled {
+    background-color: #555555;
+    color: #888888;
+}
+"""
+
+# Anything but letters, digits, spaces, '-' and '_' is dropped from labels used as filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w \-]+')
+
+# Generator settings that have no widget
+_FIXED_SETTINGS = {
+    'num_points': 25,  # value for arc smoothness
+    'enable_time_animation': True,  # Always enabled
+}
+
+# Template/sample data offered by the Templates menu, keyed by detected data type
+_TEMPLATES = {
+    "cell_tower": {
+        "filename": "tower_sector_template.csv",
+        "headers": ["Timestamp", "Latitude", "Longitude", "Azimuth"],
+        "sample_data": [
+            ["2024-01-15 14:00:00", 43.15831, -77.60938, 240],
+            ["2024-01-15 14:15:00", 43.15831, -77.60938, 240],
+            ["2024-01-15 14:30:00", 43.15400, -77.61390, 335],
+            ["2024-01-15 14:45:00", 43.15470, -77.63213, 90],
+            ["2024-01-15 15:00:00", 43.16109, -77.65102, 180],
+            ["2024-01-15 15:15:00", 43.16260, -77.67418, 180],
+            ["2024-01-15 15:30:00", 43.15831, -77.60938, 240],
+            ["2024-01-15 15:45:00", 43.15400, -77.61390, 335],
+            ["2024-01-15 16:00:00", 43.15470, -77.63213, 90],
+            ["2024-01-15 16:15:00", 43.16109, -77.65102, 180]
+        ],
+        "description": "Tower/Sector Data Template"
+    },
+
+    "timing_advance": {
+        "filename": "timing_advance_template.csv",
+        "headers": ["Timestamp", "Latitude", "Longitude", "Azimuth", "Distance"],
+        "sample_data": [
+            ["2024-01-15 14:00:00", 43.15831, -77.60938, 240, 0.8],
+            ["2024-01-15 14:03:00", 43.15831, -77.60938, 240, 1.1],
+            ["2024-01-15 14:06:00", 43.15400, -77.61390, 335, 0.4],
+            ["2024-01-15 14:09:00", 43.15470, -77.63213, 90, 3.4],
+            ["2024-01-15 14:12:00", 43.16109, -77.65102, 180, 1.7],
+            ["2024-01-15 14:15:00", 43.16260, -77.67418, 180, 2.5],
+            ["2024-01-15 14:18:00", 43.15831, -77.60938, 240, 4.2],
+            ["2024-01-15 14:21:00", 43.15400, -77.61390, 335, 1.3],
+            ["2024-01-15 14:24:00", 43.15470, -77.63213, 90, 0.5],
+            ["2024-01-15 14:27:00", 43.16109, -77.65102, 180, 1.8]
+        ],
+        "description": "Distance from Tower Data Template"
+    },
+
+    "gps": {
+        "filename": "location_point_template.csv",
+        "headers": ["Timestamp", "Latitude", "Longitude", "Accuracy"],
+        "sample_data": [
+            ["2024-01-15 14:00:00", 43.156622, -77.608895, 250],
+            ["2024-01-15 14:01:00", 43.157830, -77.605310, 200],
+            ["2024-01-15 14:02:00", 43.158941, -77.601745, 150],
+            ["2024-01-15 14:03:00", 43.159756, -77.594527, 300],
+            ["2024-01-15 14:04:00", 43.161422, -77.591803, 200],
+            ["2024-01-15 14:05:00", 43.163650, -77.590300, 150],
+            ["2024-01-15 14:06:00", 43.166050, -77.589700, 100],
+            ["2024-01-15 14:07:00", 43.168453, -77.589232, 500],
+            ["2024-01-15 14:08:00", 43.167950, -77.589800, 200],
+            ["2024-01-15 14:09:00", 43.167541, -77.590212, 150]
+        ],
+        "description": "Location Point Template"
+    }
+}
+
+# Quick-pick colors offered before the full color dialog (includes every default color)
+_QUICK_COLORS = [
+    ("Black", "#000000"),
+    ("White", "#ffffff"),
+    ("Red", "#ff0000"),
+    ("Orange", "#ff8000"),
+    ("Yellow", "#ffff00"),
+    ("Green", "#00ff00"),
+    ("Cyan", "#00ffff"),
+    ("Blue", "#0000ff"),
+    ("Magenta", "#ff00ff"),
+]
+
+# Footer version line with its GitHub and license links
+_FOOTER_HTML = 'v1.0 | <a href="https://github.com/btc-git/OS-LOC-DAT-VIZ" style="color: #4ecdc4; text-decoration: none;">Open Source Location Data Visualizer</a> | <a href="license://show" style="color: #4ecdc4; text-decoration: none;">GPL v3.0</a>'
+
+# Color-swatch button background (formatted with a #RRGGBB name)
+_SWATCH_QSS = "background-color: {}"
+
+
+def _select_in_explorer(file_path):
+    """Open an Explorer window with file_path selected via SHOpenFolderAndSelectItems (Windows); True on success"""
+    try:
+        import ctypes
+        shell32 = ctypes.windll.shell32
+        shell32.ILCreateFromPathW.restype = ctypes.c_void_p
+        shell32.ILCreateFromPathW.argtypes = [ctypes.c_wchar_p]
+        shell32.SHOpenFolderAndSelectItems.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_void_p, ctypes.c_ulong]
+        shell32.ILFree.argtypes = [ctypes.c_void_p]
+        
+        pidl = shell32.ILCreateFromPathW(file_path)
+        if not pidl:
+            return False
+        try:
+            return shell32.SHOpenFolderAndSelectItems(pidl, 0, None, 0) == 0  # S_OK
+        finally:
+            shell32.ILFree(pidl)
+    except (AttributeError, OSError):
+        return False
+
+
+def _csv_header(path):
+    """Column headers from the first non-blank line of a CSV file"""
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        return next((row for row in csv.reader(f) if any(cell.strip() for cell in row)), [])
+
+
+def _xlsx_header(path):
+    """Column headers from the first row of the first worksheet (openpyxl read-only, cell values only)"""
+    import openpyxl
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        header = next(workbook.worksheets[0].iter_rows(max_row=1, values_only=True), ())
+    finally:
+        workbook.close()
+    return [str(cell) for cell in header if cell is not None]
 
 
 class MainWindow(QMainWindow):
+    _icon = None  # Shared application icon, painted once by pushpin_icon()
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Open Source Location Data Visualizer")
         self.setGeometry(100, 100, 600, 820)  # Increased from 780 to 820 for more comfortable spacing
         
         # Set custom window icon
-        self.setWindowIcon(self.create_pushpin_icon())
+        self.setWindowIcon(self.pushpin_icon())
         
         # Initialize variables
         self.data_file = None
+        self.data_path = None  # Path form of data_file, parsed once per selection
         self.kml_generator = None
+        self.disclaimer_dialog = None
+        self.save_dialog = None
         self.settings = QSettings("OpenSource", "LocationDataVisualizer")
         
         # Set up UI
@@ -42,18 +381,21 @@ class MainWindow(QMainWindow):
         self.show_disclaimer_dialog()
         
         # Add welcome message
-        self.add_status_message("To get started, download a template file using the '📁 Templates' button.")
-        self.add_status_message("Replace the sample data in the template with your own data and save it as a CSV or XLSX file.")
-        self.add_status_message("Drag and drop your CSV or XLSX file, or click 'Browse for File', to load it into the visualizer.")
-        self.add_status_message("Adjust Settings and Colors as needed, then click 'Generate KML File' to create the KML.")
-        self.add_status_message("The KML file can be opened in Google Earth, Google My Maps, Google Earth Pro, or other kml-viewers.")
+        self.add_status_message(
+            "To get started, download a template file using the '📁 Templates' button.",
+            "Replace the sample data in the template with your own data and save it as a CSV or XLSX file.",
+            "Drag and drop your CSV or XLSX file, or click 'Browse for File', to load it into the visualizer.",
+            "Adjust Settings and Colors as needed, then click 'Generate KMZ/KML File' to create the map file.",
+            "The KMZ/KML file can be opened in Google Earth, Google My Maps, Google Earth Pro, or other kml-viewers.",
+        )
 
 
     
     def show_disclaimer_dialog(self):
-        """Show the disclaimer dialog"""
-        dialog = DisclaimerDialog(self)
-        dialog.exec()
+        """Show the disclaimer dialog (built once, then reused)"""
+        if self.disclaimer_dialog is None:
+            self.disclaimer_dialog = DisclaimerDialog(self)
+        self.disclaimer_dialog.exec()
     
     def handle_footer_link(self, link):
         """Handle clicks on footer links"""
@@ -92,45 +434,14 @@ class MainWindow(QMainWindow):
         self.template_button.setMaximumWidth(120)
         self.template_button.setToolTip("Download template CSV files with correct headers for each data type")
         self.template_button.clicked.connect(self.show_template_menu)
-        self.template_button.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                font-weight: bold;
-                padding: 6px 12px;
-                border-radius: 4px;
-                border: none;
-                margin-right: 8px;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:pressed {
-                background-color: #1e7e34;
-            }
-        """)
+        self.template_button.setStyleSheet(_TEMPLATE_BUTTON_QSS)
         
         # Info button
         self.info_button = QPushButton("ℹ️ Info")
         self.info_button.setMaximumWidth(100)
         self.info_button.setToolTip("Show important information and disclaimers")
         self.info_button.clicked.connect(self.show_disclaimer_dialog)
-        self.info_button.setStyleSheet("""
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                font-weight: bold;
-                padding: 6px 12px;
-                border-radius: 4px;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-        """)
+        self.info_button.setStyleSheet(_INFO_BUTTON_QSS)
         
         header_layout.addStretch()
         header_layout.addWidget(header_label)
@@ -142,20 +453,7 @@ class MainWindow(QMainWindow):
         
         # File input section
         file_group = QGroupBox("Input Data")
-        file_group.setStyleSheet("""
-            QGroupBox { 
-                border: 2px solid #555555; 
-                border-radius: 8px; 
-                font-weight: bold; 
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        file_group.setStyleSheet(_FILE_GROUP_QSS)
         file_layout = QVBoxLayout(file_group)
         
         # Create drag-and-drop widget
@@ -207,6 +505,13 @@ class MainWindow(QMainWindow):
         data_type_layout.addWidget(self.ta_radio)
         data_type_layout.addWidget(self.gps_radio)
         
+        # Detected type -> radio button that displays it
+        self.type_radios = {
+            "cell_tower": self.tower_radio,
+            "timing_advance": self.ta_radio,
+            "gps": self.gps_radio,
+        }
+        
         # Add custom label field
         label_layout = QVBoxLayout()
         label_layout.setContentsMargins(20, 15, 0, 0)  # Indent and add top margin
@@ -218,18 +523,7 @@ class MainWindow(QMainWindow):
         self.custom_label_input = QLineEdit()
         self.custom_label_input.setPlaceholderText("e.g., 'August 1 Warrant - Timing Advance'")
         self.custom_label_input.setMaximumWidth(300)
-        self.custom_label_input.setStyleSheet("""
-            QLineEdit {
-                padding: 6px;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QLineEdit:focus {
-                border: 1px solid #0078d4;
-            }
-        """)
+        self.custom_label_input.setStyleSheet(_LABEL_INPUT_QSS)
         label_layout.addWidget(self.custom_label_input)
         
         data_type_layout.addLayout(label_layout)
@@ -310,45 +604,14 @@ class MainWindow(QMainWindow):
         
         tab_widget.addTab(viz_tab, "Settings")
         
-        # Colors Tab
-        color_tab = QWidget()
-        color_layout = QGridLayout(color_tab)
-        
-        # Sector leg lines color
-        color_layout.addWidget(QLabel("Tower/Sector Legs:"), 0, 0)
-        self.leg_color_button = QPushButton()
+        # Colors Tab (the KML color values are set now; the swatch buttons are built when the tab is first opened)
         self.leg_color = "ff000000"  # Black
-        self.leg_color_button.setStyleSheet(f"background-color: {self.kml_to_qt_color(self.leg_color)}")
-        self.leg_color_button.clicked.connect(lambda: self.select_color("leg"))
-        color_layout.addWidget(self.leg_color_button, 0, 1)
-        
-        # Sector shaded area color
-        color_layout.addWidget(QLabel("Tower/Sector Shaded Area:"), 1, 0)
-        self.shaded_color_button = QPushButton()
         self.shaded_color = "ff00ffff"  # Yellow
-        self.shaded_color_button.setStyleSheet(f"background-color: {self.kml_to_qt_color(self.shaded_color)}")
-        self.shaded_color_button.clicked.connect(lambda: self.select_color("shaded"))
-        color_layout.addWidget(self.shaded_color_button, 1, 1)
-        
-        # Distance from Tower color
-        color_layout.addWidget(QLabel("Distance from Tower Arc Color:"), 2, 0)
-        self.ta_color_button = QPushButton()
         self.ta_color = "ff0000ff"  # Red
-        self.ta_color_button.setStyleSheet(f"background-color: {self.kml_to_qt_color(self.ta_color)}")
-        self.ta_color_button.clicked.connect(lambda: self.select_color("ta"))
-        color_layout.addWidget(self.ta_color_button, 2, 1)
-        
-        # Location Point color
-        color_layout.addWidget(QLabel("Location Point Color:"), 3, 0)
-        self.gps_color_button = QPushButton()
         self.gps_color = "ff00ff00"  # Green
-        self.gps_color_button.setStyleSheet(f"background-color: {self.kml_to_qt_color(self.gps_color)}")
-        self.gps_color_button.clicked.connect(lambda: self.select_color("gps"))
-        color_layout.addWidget(self.gps_color_button, 3, 1)
-        
-        color_layout.setRowStretch(4, 1)
-        
-        tab_widget.addTab(color_tab, "Colors")
+        self.color_tab = QWidget()
+        tab_widget.addTab(self.color_tab, "Colors")
+        tab_widget.currentChanged.connect(lambda index: self.on_settings_tab_changed(tab_widget.widget(index)))
         
         # Set maximum height for tab widget to prevent excessive space
         tab_widget.setMaximumHeight(320)
@@ -361,32 +624,12 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.progress_bar, 0)  # No stretch for progress bar
         
         # Generate button
-        self.generate_button = QPushButton("Generate KML File")
+        self.generate_button = QPushButton("Generate KMZ/KML File")
         self.generate_button.clicked.connect(self.generate_kml)
         self.generate_button.setEnabled(False)
         self.generate_button.setMinimumHeight(30)
         self.generate_button.setMinimumWidth(200)
-        self.generate_button.setStyleSheet("""
-            QPushButton {
-                font-size: 16px;
-                font-weight: bold;
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 12px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton:disabled {
-                background-color: #555555;
-                color: #888888;
-            }
-        """)
+        self.generate_button.setStyleSheet(_GENERATE_BUTTON_QSS)
         
         # Create horizontal layout to center the button
         button_layout = QHBoxLayout()
@@ -396,15 +639,18 @@ class MainWindow(QMainWindow):
         layout.addLayout(button_layout, 0)  # No stretch for button
         
         # Status text
-        self.status_text = QTextEdit()
+        self.status_text = QPlainTextEdit()
         self.status_text.setMinimumHeight(80)
         self.status_text.setReadOnly(True)
+        self.status_text.setMaximumBlockCount(1000)  # Keep the log bounded; oldest lines drop off
         layout.addWidget(self.status_text, 1)  # Add stretch to fill remaining space
         
         # Footer with version info (clickable links)
         footer_layout = QHBoxLayout()
         footer_layout.setContentsMargins(0, 5, 0, 5) # top and bottom margins
-        version_label = QLabel('v1.0 | <a href="https://github.com/btc-git/OS-LOC-DAT-VIZ" style="color: #4ecdc4; text-decoration: none;">Open Source Location Data Visualizer</a> | <a href="license://show" style="color: #4ecdc4; text-decoration: none;">GPL v3.0</a>')
+        version_label = QLabel()
+        version_label.setTextFormat(Qt.TextFormat.RichText)  # Known HTML, skip Qt's rich-text detection
+        version_label.setText(_FOOTER_HTML)
         version_label.setStyleSheet("color: #666666; font-size: 10px; font-style: italic;")
         version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         version_label.linkActivated.connect(self.handle_footer_link)
@@ -415,128 +661,48 @@ class MainWindow(QMainWindow):
         
         layout.addLayout(footer_layout, 0)  # No stretch footer
     
+    def on_settings_tab_changed(self, tab):
+        """Build the Colors tab's widgets the first time it is opened"""
+        if tab is self.color_tab and self.color_tab.layout() is None:
+            self.build_color_tab()
+    
+    def build_color_tab(self):
+        """Populate the Colors tab with a swatch button per color setting"""
+        color_layout = QGridLayout(self.color_tab)
+        
+        # Sector leg lines color
+        color_layout.addWidget(QLabel("Tower/Sector Legs:"), 0, 0)
+        self.leg_color_button = QPushButton()
+        self.leg_color_button.setStyleSheet(_SWATCH_QSS.format(self.kml_to_qt_color(self.leg_color)))
+        self.leg_color_button.clicked.connect(lambda: self.select_color("leg"))
+        color_layout.addWidget(self.leg_color_button, 0, 1)
+        
+        # Sector shaded area color
+        color_layout.addWidget(QLabel("Tower/Sector Shaded Area:"), 1, 0)
+        self.shaded_color_button = QPushButton()
+        self.shaded_color_button.setStyleSheet(_SWATCH_QSS.format(self.kml_to_qt_color(self.shaded_color)))
+        self.shaded_color_button.clicked.connect(lambda: self.select_color("shaded"))
+        color_layout.addWidget(self.shaded_color_button, 1, 1)
+        
+        # Distance from Tower color
+        color_layout.addWidget(QLabel("Distance from Tower Arc Color:"), 2, 0)
+        self.ta_color_button = QPushButton()
+        self.ta_color_button.setStyleSheet(_SWATCH_QSS.format(self.kml_to_qt_color(self.ta_color)))
+        self.ta_color_button.clicked.connect(lambda: self.select_color("ta"))
+        color_layout.addWidget(self.ta_color_button, 2, 1)
+        
+        # Location Point color
+        color_layout.addWidget(QLabel("Location Point Color:"), 3, 0)
+        self.gps_color_button = QPushButton()
+        self.gps_color_button.setStyleSheet(_SWATCH_QSS.format(self.kml_to_qt_color(self.gps_color)))
+        self.gps_color_button.clicked.connect(lambda: self.select_color("gps"))
+        color_layout.addWidget(self.gps_color_button, 3, 1)
+        
+        color_layout.setRowStretch(4, 1)
+    
     def apply_dark_theme(self):
         """Apply dark theme to the application"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #555555;
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                background-color: #404040;
-                border: 1px solid #555555;
-                padding: 8px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-            QPushButton:pressed {
-                background-color: #353535;
-            }
-            QPushButton:disabled {
-                background-color: #2b2b2b;
-                color: #666666;
-            }
-            QRadioButton::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QRadioButton::indicator::unchecked {
-                border: 2px solid #555555;
-                border-radius: 9px;
-                background-color: #2b2b2b;
-            }
-            QRadioButton::indicator::checked {
-                border: 2px solid #0078d4;
-                border-radius: 9px;
-                background-color: #0078d4;
-            }
-            QSpinBox, QDoubleSpinBox {
-                background-color: #404040;
-                border: 1px solid #555555;
-                padding: 4px;
-                border-radius: 4px;
-            }
-            QComboBox {
-                background-color: #404040;
-                border: 1px solid #555555;
-                padding: 4px;
-                border-radius: 4px;
-                min-height: 16px;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left-width: 1px;
-                border-left-color: #555555;
-                border-left-style: solid;
-                border-top-right-radius: 3px;
-                border-bottom-right-radius: 3px;
-                background-color: #505050;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 6px solid #ffffff;
-                width: 0px;
-                height: 0px;
-            }
-            QTabWidget::pane {
-                border: 1px solid #555555;
-                background-color: #2b2b2b;
-            }
-            QTabBar::tab {
-                background-color: #404040;
-                padding: 8px 12px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: #0078d4;
-            }
-            QTabBar::tab:hover {
-                background-color: #505050;
-            }
-            QTextEdit {
-                background-color: #1e1e1e;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QProgressBar {
-                border: 1px solid #555555;
-                border-radius: 4px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #0078d4;
-                border-radius: 3px;
-            }
-            QFrame {
-                border: none;
-            }
-        """)
+        self.setStyleSheet(_MAIN_WINDOW_QSS)
     
     def select_file(self):
         """Open file dialog to select CSV or Excel file"""
@@ -557,7 +723,8 @@ class MainWindow(QMainWindow):
     def handle_file_selection(self, file_path):
         """Handler for file selection (both browse and drag-drop)"""
         self.data_file = file_path
-        filename = Path(file_path).name
+        self.data_path = Path(file_path)
+        filename = self.data_path.name
         
         # Clear custom label field for new file
         self.custom_label_input.clear()
@@ -573,89 +740,59 @@ class MainWindow(QMainWindow):
         
         # Validate file format and auto-detect data type
         try:
-            # Read file based on extension (with Excel date handling)
-            file_extension = Path(file_path).suffix.lower()
+            # Read only the header row based on extension (no DataFrame needed to detect the type)
+            file_extension = self.data_path.suffix.lower()
             if file_extension == '.xlsx':
-                df = pd.read_excel(file_path, nrows=1, engine='openpyxl')
+                header = _xlsx_header(file_path)
                 self.add_status_message("📊 Reading Excel file...")
             elif file_extension == '.csv':
-                df = pd.read_csv(file_path, nrows=1)
+                header = _csv_header(file_path)
                 self.add_status_message("📄 Reading CSV file...")
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}. Please use .csv or .xlsx files.")
             
-            columns = [col.lower().strip() for col in df.columns]
+            columns = frozenset(col.lower().strip() for col in header)
+            present = {field for field, names in _HEADER_SETS.items() if not columns.isdisjoint(names)}
+            has_core = {'lat', 'lon', 'timestamp'} <= present
+            has_azimuth = 'azimuth' in present
+            has_distance = 'distance' in present
             detected_type = None
             
             # Check for exact template matches
             # Distance from Tower Template: Timestamp, Latitude, Longitude, Azimuth, Distance
-            if (any(col in ['latitude', 'lat'] for col in columns) and
-                any(col in ['longitude', 'lon', 'long'] for col in columns) and
-                any(col in ['timestamp', 'date & time', 'datetime', 'time'] for col in columns) and
-                any(col in ['azimuth', 'bearing', 'direction'] for col in columns) and
-                any(col in ['distance', 'range', 'distance (m)', 'distance (meters)'] for col in columns)):
+            if has_core and has_azimuth and has_distance:
                 detected_type = "timing_advance"
-                self.ta_radio.setChecked(True)
                 self.add_status_message("✅ Valid Distance from Tower template detected")
                 
             # Tower/Sector Template: Latitude, Longitude, Timestamp, Azimuth
-            elif (any(col in ['latitude', 'lat'] for col in columns) and
-                  any(col in ['longitude', 'lon', 'long'] for col in columns) and
-                  any(col in ['timestamp', 'date & time', 'datetime', 'time'] for col in columns) and
-                  any(col in ['azimuth', 'bearing', 'direction'] for col in columns) and
-                  not any(col in ['distance', 'range', 'distance (m)', 'distance (meters)'] for col in columns)):
+            elif has_core and has_azimuth:
                 detected_type = "cell_tower"
-                self.tower_radio.setChecked(True)
                 self.add_status_message("✅ Valid Tower/Sector template detected")
                 
             # Location Point Template: Latitude, Longitude, Timestamp, (optional) Accuracy
-            elif (any(col in ['latitude', 'lat'] for col in columns) and
-                  any(col in ['longitude', 'lon', 'long'] for col in columns) and
-                  any(col in ['timestamp', 'date & time', 'datetime', 'time'] for col in columns) and
-                  not any(col in ['azimuth', 'bearing', 'direction'] for col in columns)):
+            elif has_core and not has_azimuth:
                 detected_type = "gps"
-                self.gps_radio.setChecked(True)
                 self.add_status_message("✅ Valid Location Point template detected")
-                if any(col in ['gps accuracy', 'accuracy', 'gps_accuracy'] for col in columns):
+                if 'accuracy' in present:
                     self.add_status_message("✅ Location Point Accuracy column detected - circles will be sized accordingly")
             
+            # Enable and check only the detected type's radio button (clears them all for invalid files)
+            self.show_detected_type(detected_type)
+            
             # Enable generation only if valid template detected
             if detected_type:
                 self.generate_button.setEnabled(True)
                 self.file_label.setText(f"✅ {filename}")
                 self.file_label.setStyleSheet("color: #00ff00; font-weight: bold;")
                 self.drag_drop_widget.drop_label.setText(f"📁 Ready: {filename}\n\nDrag another CSV to replace")
-                
-                # Enable radio button to show detection result
-                if detected_type == "cell_tower":
-                    self.tower_radio.setEnabled(True)
-                    self.ta_radio.setEnabled(False)
-                    self.gps_radio.setEnabled(False)
-                elif detected_type == "timing_advance":
-                    self.tower_radio.setEnabled(False)
-                    self.ta_radio.setEnabled(True)
-                    self.gps_radio.setEnabled(False)
-                elif detected_type == "gps":
-                    self.tower_radio.setEnabled(False)
-                    self.ta_radio.setEnabled(False)
-                    self.gps_radio.setEnabled(True)
             else:
                 # Invalid format - disable generation and show error
                 self.generate_button.setEnabled(False)
                 self.file_label.setText(f"❌ {filename} (Invalid Format)")
                 self.file_label.setStyleSheet("color: #ff6666; font-weight: bold;")
                 self.drag_drop_widget.drop_label.setText(f"❌ Invalid Format: {filename}\n\nUse Templates button to download correct format")
-                self.add_status_message("❌ Column headers don't match any template format")
-                self.add_status_message("💡 Click 'Templates' button to download correct CSV format")
-                
-                # Disable all radio buttons for invalid files
-                self.tower_radio.setEnabled(False)
-                self.ta_radio.setEnabled(False)
-                self.gps_radio.setEnabled(False)
-                # Clear any previous selections
-                self.tower_radio.setChecked(False)
-                self.ta_radio.setChecked(False)
-                self.gps_radio.setChecked(False)
+                self.add_status_message("❌ Column headers don't match any template format",
+                                        "💡 Click 'Templates' button to download correct CSV format")
                 
         except Exception as e:
             # File reading error - disable generation
@@ -663,19 +800,40 @@ class MainWindow(QMainWindow):
             self.file_label.setText(f"❌ {filename} (Error)")
             self.file_label.setStyleSheet("color: #ff6666; font-weight: bold;")
             self.drag_drop_widget.drop_label.setText(f"❌ Error reading: {filename}\n\nCheck file format and try again")
-            self.add_status_message(f"❌ Error reading CSV file: {str(e)}")
-            self.add_status_message("💡 Ensure file is a valid CSV with proper headers")
+            self.add_status_message(f"❌ Error reading CSV file: {str(e)}",
+                                    "💡 Ensure file is a valid CSV with proper headers")
             
-            # Disable all radio buttons for error cases
-            self.tower_radio.setEnabled(False)
-            self.ta_radio.setEnabled(False)
-            self.gps_radio.setEnabled(False)
-            # Clear any previous selections
-            self.tower_radio.setChecked(False)
-            self.ta_radio.setChecked(False)
-            self.gps_radio.setChecked(False)
+            # Disable and clear all radio buttons for error cases
+            self.show_detected_type(None)
+    
+    def show_detected_type(self, detected_type):
+        """Enable and check the radio button for detected_type, disabling and unchecking the others"""
+        # An exclusive group refuses to uncheck its checked button, so lift exclusivity while updating
+        self.data_type_group.setExclusive(False)
+        for key, radio in self.type_radios.items():
+            radio.setEnabled(key == detected_type)
+            radio.setChecked(key == detected_type)
+        self.data_type_group.setExclusive(True)
     
     def select_color(self, color_type):
+        """Show a quick-pick menu of common colors; its "More colors..." entry opens the full color dialog"""
+        button = getattr(self, f"{color_type}_color_button")
+        menu = QMenu(self)
+        
+        for name, hex_color in _QUICK_COLORS:
+            swatch = QPixmap(16, 16)
+            swatch.fill(QColor(hex_color))
+            action = menu.addAction(QIcon(swatch), name)
+            action.triggered.connect(lambda checked, c=hex_color: self.apply_color(color_type, QColor(c)))
+        
+        menu.addSeparator()
+        more_action = menu.addAction("More colors...")
+        more_action.triggered.connect(lambda: self.select_color_from_dialog(color_type))
+        
+        # Show menu below the button
+        menu.exec(button.mapToGlobal(button.rect().bottomLeft()))
+    
+    def select_color_from_dialog(self, color_type):
         """Open color dialog to select colors"""
         current_color = getattr(self, f"{color_type}_color")
         qt_color = QColor(self.kml_to_qt_color(current_color))
@@ -683,13 +841,17 @@ class MainWindow(QMainWindow):
         color = QColorDialog.getColor(qt_color, self, f"Select {color_type.title()} Color")
         
         if color.isValid():
-            kml_color = self.qt_to_kml_color(color)
-            setattr(self, f"{color_type}_color", kml_color)
-            
-            button = getattr(self, f"{color_type}_color_button")
-            button.setStyleSheet(f"background-color: {color.name()}")
-            
-            self.add_status_message(f"Changed {color_type} color to {color.name()}")
+            self.apply_color(color_type, color)
+    
+    def apply_color(self, color_type, color):
+        """Store a picked color (as KML AABBGGRR) and repaint its swatch button"""
+        kml_color = self.qt_to_kml_color(color)
+        setattr(self, f"{color_type}_color", kml_color)
+        
+        button = getattr(self, f"{color_type}_color_button")
+        button.setStyleSheet(_SWATCH_QSS.format(color.name()))
+        
+        self.add_status_message(f"Changed {color_type} color to {color.name()}")
     
     def kml_to_qt_color(self, kml_color):
         """Convert KML color (AABBGGRR) to Qt color format (#RRGGBB)"""
@@ -707,38 +869,37 @@ class MainWindow(QMainWindow):
         b = format(qt_color.blue(), '02x')
         return f"ff{b}{g}{r}"
     
-    def add_status_message(self, message):
-        """Add message to status text area"""
-        self.status_text.append(f"• {message}")
-        # Ensure the console always scrolls to show the latest message
-        cursor = self.status_text.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        self.status_text.setTextCursor(cursor)
-        self.status_text.ensureCursorVisible()
+    def add_status_message(self, *messages):
+        """Add one or more messages to status text area (several messages go in as a single append)"""
+        # A read-only QPlainTextEdit follows new lines by itself while scrolled to the bottom,
+        # and leaves the view alone when the user has scrolled up to read earlier messages
+        self.status_text.appendPlainText("\n".join(f"• {message}" for message in messages))
     
     def open_file_location(self, file_path):
         """Open file explorer and highlight the specified file"""
         try:
-            file_path = Path(file_path).resolve()
+            # Absolute, normalized path without resolve()'s per-component stat/symlink walk (slow on network shares)
+            file_path = Path(os.path.abspath(file_path))
             
             if sys.platform == 'win32':
-                # Windows: Use explorer with /select flag to highlight the file
-                result = subprocess.run(['explorer', '/select,', str(file_path)], 
-                                      capture_output=True, text=True)
-                self.add_status_message(f"📂 Opening file location: {file_path.parent}")
-                
+                # Windows: highlight the file through the shell API in-process; fall back to
+                # launching explorer with the /select flag if that is unavailable
+                command = None if _select_in_explorer(str(file_path)) else ['explorer', '/select,', str(file_path)]
             elif sys.platform == 'darwin':
                 # Possible future macOS support
-                result = subprocess.run(['open', '-R', str(file_path)], check=True)
-                self.add_status_message(f"📂 Opening file location: {file_path.parent}")
-                
+                command = ['open', '-R', str(file_path)]
             else:
                 # Possible future Linux support
-                result = subprocess.run(['xdg-open', str(file_path.parent)], check=True)
-                self.add_status_message(f"📂 Opening file location: {file_path.parent}")
+                command = ['xdg-open', str(file_path.parent)]
+            
+            # Launch without waiting: the file browser can take a moment to appear and its exit
+            # status is never used, so the GUI thread should not block on it
+            if command:
+                import subprocess
+                subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                 start_new_session=True)
+            self.add_status_message(f"📂 Opening file location: {file_path.parent}")
                 
-        except subprocess.CalledProcessError as e:
-            self.add_status_message(f"⚠️ Could not open file location: {str(e)}")
         except Exception as e:
             self.add_status_message(f"⚠️ Error opening file location: {str(e)}")
     
@@ -756,12 +917,12 @@ class MainWindow(QMainWindow):
         else:
             data_type = "Location Point"
         
-        # Collect settings
+        # Collect settings (fixed values first, then the current widget values)
         settings = {
+            **_FIXED_SETTINGS,
             'leg_length': self.leg_length_spinbox.value(),
             'shaded_area_length': self.shaded_area_spinbox.value(),
             'azimuth_spread': self.azimuth_spinbox.value(),
-            'num_points': 25,  # value for arc smoothness
             'leg_color': self.leg_color,
             'shaded_color': self.shaded_color,
             'ta_color': self.ta_color,
@@ -769,7 +930,6 @@ class MainWindow(QMainWindow):
             'gps_units': self.gps_units_combo.currentText(),
             'ta_distance_units': self.ta_distance_units_combo.currentText(),
             'default_accuracy': self.default_accuracy_spinbox.value(),
-            'enable_time_animation': True,  # Always enabled
             'duration_minutes': self.duration_spinbox.value(),
             'custom_label': self.custom_label_input.text().strip() or None
         }
@@ -781,7 +941,8 @@ class MainWindow(QMainWindow):
         
         self.add_status_message(f"Starting KML generation for {data_type} data...")
         
-        # Create and start worker thread
+        # Create and start worker thread (kml_generator pulls in pandas, so it is imported on first use)
+        from kml_generator import KMLGenerator
         self.kml_generator = KMLGenerator(self.data_file, data_type, settings)
         self.kml_generator.progress.connect(self.progress_bar.setValue)
         self.kml_generator.finished.connect(self.on_generation_finished)
@@ -789,52 +950,97 @@ class MainWindow(QMainWindow):
         self.kml_generator.status_message.connect(self.add_status_message)
         self.kml_generator.start()
     
-    def on_generation_finished(self, kml_content):
-        """Handle successful KML generation"""
+    def ask_save_path(self, title, suggested_path, name_filters):
+        """Ask for a save location with the shared save dialog; returns (path, selected filter), path empty if cancelled"""
+        # One dialog instance, built on first use, is reused for every save so its
+        # directory state and listing carry over instead of being rebuilt each time
+        if self.save_dialog is None:
+            self.save_dialog = QFileDialog(self)
+            self.save_dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            # Skip per-folder custom icon lookups (very slow on network shares)
+            self.save_dialog.setOption(QFileDialog.Option.DontUseCustomDirectoryIcons, True)
+        
+        dialog = self.save_dialog
+        dialog.setWindowTitle(title)
+        dialog.setNameFilter(name_filters)
+        dialog.selectNameFilter(name_filters.split(";;")[0])
+        dialog.selectFile(suggested_path)
+        
+        if dialog.exec():
+            return dialog.selectedFiles()[0], dialog.selectedNameFilter()
+        return "", ""
+    
+    def on_generation_finished(self, kmz_path):
+        """Handle successful KML generation (kmz_path is the generator's temporary KMZ file)"""
         self.progress_bar.setVisible(False)
         self.generate_button.setEnabled(True)
         
         # Show file save dialog
-        base_name = Path(self.data_file).stem
+        base_name = self.data_path.stem
         
         # Use custom label for filename if provided, otherwise use base name
         custom_label = self.custom_label_input.text().strip()
         if custom_label:
             # Clean custom label for filename
-            safe_label = "".join(c for c in custom_label if c.isalnum() or c in (' ', '-', '_')).strip()
+            safe_label = _UNSAFE_FILENAME_CHARS.sub('', custom_label).strip()
             safe_label = safe_label.replace(' ', '_')
-            suggested_filename = f"{safe_label}.kml"
+            suggested_filename = f"{safe_label}.kmz"
         else:
-            suggested_filename = f"{base_name}_visualization.kml"
+            suggested_filename = f"{base_name}_visualization.kmz"
             
-        start_dir = str(Path(self.data_file).parent / suggested_filename)
+        start_dir = str(self.data_path.parent / suggested_filename)
         
-        output_file, _ = QFileDialog.getSaveFileName(
-            self,
-            "Save KML File",
+        output_file, selected_filter = self.ask_save_path(
+            "Save KMZ/KML File",
             start_dir,
-            "KML Files (*.kml);;All Files (*)"
+            "KMZ Files (*.kmz);;KML Files (*.kml);;All Files (*)"
         )
         
-        if output_file:
-            try:
-                # Save KML content to file
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(kml_content)
-                
-                self.add_status_message(f"✅ KML file saved successfully: {Path(output_file).name}")
-                
-                # Open file location and highlight file
-                self.open_file_location(output_file)
-            except Exception as e:
-                self.add_status_message(f"❌ Error saving file: {str(e)}")
-                QMessageBox.critical(
-                    self,
-                    "Save Error",
-                    f"Failed to save KML file:\n\n{str(e)}"
-                )
-        else:
-            self.add_status_message("⚠️ File save cancelled by user")
+        try:
+            if output_file:
+                try:
+                    # The chosen file type decides the format, even if the typed name says otherwise
+                    output_path = Path(output_file)
+                    wanted_suffix = {"KMZ": '.kmz', "KML": '.kml'}.get(selected_filter[:3])
+                    if wanted_suffix and output_path.suffix.lower() != wanted_suffix:
+                        if output_path.suffix.lower() in ('.kml', '.kmz'):
+                            output_path = output_path.with_suffix(wanted_suffix)
+                        else:
+                            output_path = output_path.with_name(output_path.name + wanted_suffix)
+                    output_file = str(output_path)
+                    
+                    # Write through QSaveFile so the target only appears (or is replaced) once
+                    # fully written; an error or crash mid-write leaves any existing file intact
+                    save_file = QSaveFile(output_file)
+                    if not save_file.open(QIODevice.OpenModeFlag.WriteOnly):
+                        raise OSError(save_file.errorString())
+                    file_type = 'KML' if output_path.suffix.lower() == '.kml' else 'KMZ'
+                    if file_type == 'KML':
+                        # Unzip the generated document into a plain KML file
+                        from kml_generator import write_kml
+                        write_kml(kmz_path, save_file)
+                    else:
+                        # Copy the generated KMZ into place
+                        with open(kmz_path, 'rb') as src:
+                            shutil.copyfileobj(src, save_file, 1024 * 1024)
+                    if not save_file.commit():
+                        raise OSError(save_file.errorString())
+                    
+                    self.add_status_message(f"✅ {file_type} file saved successfully: {Path(output_file).name}")
+                    
+                    # Open file location and highlight file
+                    self.open_file_location(output_file)
+                except Exception as e:
+                    self.add_status_message(f"❌ Error saving file: {str(e)}")
+                    QMessageBox.critical(
+                        self,
+                        "Save Error",
+                        f"Failed to save KMZ/KML file:\n\n{str(e)}"
+                    )
+            else:
+                self.add_status_message("⚠️ File save cancelled by user")
+        finally:
+            Path(kmz_path).unlink(missing_ok=True)
     
     def on_generation_error(self, error_message):
         """Handle KML generation error"""
@@ -846,7 +1052,7 @@ class MainWindow(QMainWindow):
         QMessageBox.critical(
             self, 
             "Error", 
-            f"Failed to generate KML file:\n\n{error_message}"
+            f"Failed to generate KMZ/KML file:\n\n{error_message}"
         )
     
     def show_template_menu(self):
@@ -870,71 +1076,13 @@ class MainWindow(QMainWindow):
     
     def download_template(self, template_type):
         """Download a specific CSV template"""
-        # Define template/sample data
-        templates = {
-            "cell_tower": {
-                "filename": "tower_sector_template.csv",
-                "headers": ["Timestamp", "Latitude", "Longitude", "Azimuth"],
-                "sample_data": [
-                    ["2024-01-15 14:00:00", 43.15831, -77.60938, 240],
-                    ["2024-01-15 14:15:00", 43.15831, -77.60938, 240],
-                    ["2024-01-15 14:30:00", 43.15400, -77.61390, 335],
-                    ["2024-01-15 14:45:00", 43.15470, -77.63213, 90],
-                    ["2024-01-15 15:00:00", 43.16109, -77.65102, 180],
-                    ["2024-01-15 15:15:00", 43.16260, -77.67418, 180],
-                    ["2024-01-15 15:30:00", 43.15831, -77.60938, 240],
-                    ["2024-01-15 15:45:00", 43.15400, -77.61390, 335],
-                    ["2024-01-15 16:00:00", 43.15470, -77.63213, 90],
-                    ["2024-01-15 16:15:00", 43.16109, -77.65102, 180]
-                ],
-                "description": "Tower/Sector Data Template"
-            },
-
-            "timing_advance": {
-                "filename": "timing_advance_template.csv",
-                "headers": ["Timestamp", "Latitude", "Longitude", "Azimuth", "Distance"],
-                "sample_data": [
-                    ["2024-01-15 14:00:00", 43.15831, -77.60938, 240, 0.8],
-                    ["2024-01-15 14:03:00", 43.15831, -77.60938, 240, 1.1],
-                    ["2024-01-15 14:06:00", 43.15400, -77.61390, 335, 0.4],
-                    ["2024-01-15 14:09:00", 43.15470, -77.63213, 90, 3.4],
-                    ["2024-01-15 14:12:00", 43.16109, -77.65102, 180, 1.7],
-                    ["2024-01-15 14:15:00", 43.16260, -77.67418, 180, 2.5],
-                    ["2024-01-15 14:18:00", 43.15831, -77.60938, 240, 4.2],
-                    ["2024-01-15 14:21:00", 43.15400, -77.61390, 335, 1.3],
-                    ["2024-01-15 14:24:00", 43.15470, -77.63213, 90, 0.5],
-                    ["2024-01-15 14:27:00", 43.16109, -77.65102, 180, 1.8]
-                ],
-                "description": "Distance from Tower Data Template"
-            },
-
-            "gps": {
-                "filename": "location_point_template.csv",
-                "headers": ["Timestamp", "Latitude", "Longitude", "Accuracy"],
-                "sample_data": [
-                    ["2024-01-15 14:00:00", 43.156622, -77.608895, 250],
-                    ["2024-01-15 14:01:00", 43.157830, -77.605310, 200],
-                    ["2024-01-15 14:02:00", 43.158941, -77.601745, 150],
-                    ["2024-01-15 14:03:00", 43.159756, -77.594527, 300],
-                    ["2024-01-15 14:04:00", 43.161422, -77.591803, 200],
-                    ["2024-01-15 14:05:00", 43.163650, -77.590300, 150],
-                    ["2024-01-15 14:06:00", 43.166050, -77.589700, 100],
-                    ["2024-01-15 14:07:00", 43.168453, -77.589232, 500],
-                    ["2024-01-15 14:08:00", 43.167950, -77.589800, 200],
-                    ["2024-01-15 14:09:00", 43.167541, -77.590212, 150]
-                ],
-                "description": "Location Point Template"
-            }
-        }
-        
-        if template_type not in templates:
+        if template_type not in _TEMPLATES:
             return
         
-        template = templates[template_type]
+        template = _TEMPLATES[template_type]
         
         # Show save dialog
-        output_file, _ = QFileDialog.getSaveFileName(
-            self,
+        output_file, _ = self.ask_save_path(
             f"Save {template['description']}",
             template['filename'],
             "CSV Files (*.csv);;All Files (*)"
@@ -942,11 +1090,11 @@ class MainWindow(QMainWindow):
         
         if output_file:
             try:
-                # Create DataFrame with template data
-                df = pd.DataFrame(template['sample_data'], columns=template['headers'])
-                
-                # Save to CSV
-                df.to_csv(output_file, index=False)
+                # Save to CSV (text mode keeps the platform's line endings, as pandas' to_csv did)
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    writer = csv.writer(f, lineterminator='\n')
+                    writer.writerow(template['headers'])
+                    writer.writerows(template['sample_data'])
                 
                 self.add_status_message(f"✅ Template saved: {Path(output_file).name}")
                 
@@ -974,7 +1122,15 @@ class MainWindow(QMainWindow):
         else:
             self.add_status_message("⚠️ Template download cancelled")
     
-    def create_pushpin_icon(self):
+    @classmethod
+    def pushpin_icon(cls):
+        """Return the application icon, painting it on first use"""
+        if cls._icon is None:
+            cls._icon = cls.create_pushpin_icon()
+        return cls._icon
+    
+    @staticmethod
+    def create_pushpin_icon():
         """Create a traditional WiFi icon for the application"""
         # Create a 32x32 pixel icon
         pixmap = QPixmap(32, 32)
@@ -8,6 +8,17 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QDragEnterEvent, QDropEvent
 
 
+def _first_supported_file(mime_data):
+    """Local path of the first CSV or Excel file among the dragged URLs (None if there is none)"""
+    if mime_data.hasUrls():
+        for url in mime_data.urls():
+            if url.isLocalFile():
+                file_path = url.toLocalFile()
+                if file_path.lower().endswith(('.csv', '.xlsx')):
+                    return file_path
+    return None
+
+
 class DragDropWidget(QFrame):
     """Custom widget that accepts drag and drop for CSV and Excel files"""
     file_dropped = pyqtSignal(str)  # Signal emitted when file is dropped
@@ -40,6 +51,7 @@ class DragDropWidget(QFrame):
         layout.addSpacing(12)  # Add space above button for symmetry
         layout.addWidget(self.browse_button, alignment=Qt.AlignmentFlag.AlignCenter)
         
+        self.setProperty("dragActive", False)
         self.setStyleSheet("""
             DragDropWidget {
                 border: 2px dashed #555555;
@@ -52,44 +64,35 @@ class DragDropWidget(QFrame):
             }
         """)
     
+    def set_drag_active(self, active):
+        """Switch the drop-zone highlight, re-polishing the stylesheet only when the state changes"""
+        if self.property("dragActive") == active:
+            return
+        self.setProperty("dragActive", active)
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
+    
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter event"""
-        if event.mimeData().hasUrls():
-            # Check if any of the URLs point to CSV or Excel files
-            urls = event.mimeData().urls()
-            for url in urls:
-                if url.isLocalFile():
-                    file_path = url.toLocalFile()
-                    if file_path.lower().endswith(('.csv', '.xlsx')):
-                        event.acceptProposedAction()
-                        self.setProperty("dragActive", True)
-                        self.style().unpolish(self)
-                        self.style().polish(self)
-                        self.update()
-                        return
+        # Accept if any of the URLs point to CSV or Excel files
+        if _first_supported_file(event.mimeData()):
+            event.acceptProposedAction()
+            self.set_drag_active(True)
+            return
         event.ignore()
     
     def dragLeaveEvent(self, event):
         """Handle drag leave event"""
-        self.setProperty("dragActive", False)
-        self.style().unpolish(self)
-        self.style().polish(self)
-        self.update()
+        self.set_drag_active(False)
     
     def dropEvent(self, event: QDropEvent):
         """Handle drop event"""
-        self.setProperty("dragActive", False)
-        self.style().unpolish(self)
-        self.style().polish(self)
-        self.update()
+        self.set_drag_active(False)
         
-        if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
-            for url in urls:
-                if url.isLocalFile():
-                    file_path = url.toLocalFile()
-                    if file_path.lower().endswith(('.csv', '.xlsx')):
-                        self.file_dropped.emit(file_path)
-                        event.acceptProposedAction()
-                        return
+        file_path = _first_supported_file(event.mimeData())
+        if file_path:
+            self.file_dropped.emit(file_path)
+            event.acceptProposedAction()
+            return
         event.ignore()